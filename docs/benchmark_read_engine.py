@@ -0,0 +1,66 @@
+import pathlib
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from pphys import read
+
+# Synthetic 0.1 ft log with 120 curves; 400,000 samples gives roughly 450 MB.
+
+nsamples = int(sys.argv[1]) if len(sys.argv)>1 else 400_000
+ncurves = int(sys.argv[2]) if len(sys.argv)>2 else 120
+
+def write_las(path,nsamples,ncurves):
+
+	depths = 1000.+0.1*np.arange(nsamples)
+
+	lines = [
+		"~Version ---------------------------------------------------",
+		"VERS.   2.0 : CWLS log ASCII Standard -VERSION 2.0",
+		"WRAP.    NO : One line per depth step",
+		"~Well ------------------------------------------------------",
+		f"STRT.ft {depths[0]:.4f} : START DEPTH",
+		f"STOP.ft {depths[-1]:.4f} : STOP DEPTH",
+		"STEP.ft 0.1000 : STEP",
+		"NULL.    -999.25 : NULL VALUE",
+		"WELL.    BENCH-1 : WELL",
+		"~Curve Information -----------------------------------------",
+		"DEPT.ft : depths",
+		]
+
+	lines += [f"C{index:03d}.api : synthetic curve" for index in range(1,ncurves)]
+
+	lines += ["~ASCII -----------------------------------------------------"]
+
+	with open(path,"w") as f:
+		f.write("\n".join(lines)+"\n")
+
+		for start in range(0,nsamples,50_000):
+			block = np.random.rand(min(50_000,nsamples-start),ncurves)*100
+			block[:,0] = depths[start:start+block.shape[0]]
+			block[::97,1] = -999.25
+			np.savetxt(f,block,fmt="%.4f")
+
+with tempfile.TemporaryDirectory() as folder:
+
+	path = pathlib.Path(folder)/"bench.las"
+
+	write_las(path,nsamples,ncurves)
+
+	print(f"{path.stat().st_size/1e6:.1f} MB, {nsamples} samples, {ncurves} curves")
+
+	timings = {}
+
+	for engine in (None,"fast"):
+
+		start = time.perf_counter()
+
+		las = read(str(path),engine=engine)
+
+		timings[engine] = time.perf_counter()-start
+
+		print(f"engine={engine!s:<5}: {timings[engine]:8.2f} s, data shape {las.data.shape}")
+
+	print(f"speed-up: {timings[None]/timings['fast']:.1f}x")
@@ -4,4 +4,7 @@ from . import interpret
 from . import stream
 
 from ._read import read
-from ._load import load
\ No newline at end of file
+from ._load import load
+from ._normalize import Normalize
+from ._scan import scan
+from ._window import windows, window
\ No newline at end of file
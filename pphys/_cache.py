@@ -0,0 +1,202 @@
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+
+import numpy
+
+from ._lasio import LASIO
+
+class Cache():
+	"""Columnar cache of a single LAS file: one .npy file per curve and a small
+	JSON header sidecar. Curves are memory-mapped on load, so they page in lazily
+	and resident memory scales with the curves actually touched."""
+
+	def __init__(self,folder):
+		"""Initializes the cache in the given folder, one folder per LAS file."""
+		self.folder = pathlib.Path(folder)
+
+	@property
+	def header(self) -> pathlib.Path:
+		"""Path of the JSON header sidecar."""
+		return self.folder / "header.json"
+
+	def exists(self) -> bool:
+		"""Returns True if a complete cache is available in the folder."""
+		return self.header.exists()
+
+	def dump(self,las:LASIO):
+		"""Writes the curves of the LAS object as .npy files and its header as JSON.
+		The header is written last, so an interrupted dump is never loaded."""
+		self.folder.mkdir(parents=True,exist_ok=True)
+
+		self.header.unlink(missing_ok=True)
+
+		for npy in self.folder.glob("*.npy"):
+			npy.unlink()
+
+		for index,curve in enumerate(las.curves):
+			numpy.save(self.curve(index),Cache.column(curve.data))
+
+		temp = self.header.with_suffix(".tmp")
+
+		with open(temp,"w") as f:
+			json.dump(las.header(),f)
+
+		os.replace(temp,self.header)
+
+	def load(self,mmap_mode:str="r") -> LASIO:
+		"""Loads the LAS object with its curves memory-mapped from the .npy files.
+
+		Parameters:
+		----------
+		mmap_mode : Passed to numpy.load; "r" keeps curves read-only and zero-copy,
+					"c" allows in-memory edits and None reads curves into memory.
+
+		Returns:
+		-------
+		LASIO: The LAS object.
+		"""
+		with open(self.header,"r") as f:
+			header = json.load(f)
+
+		ncurves = len(header["sections"]["Curves"])
+
+		arrays = [Cache.array(self.curve(index),mmap_mode) for index in range(ncurves)]
+
+		return LASIO.assemble(header,arrays)
+
+	def write(self,mnemonic:str,data,unit:str="",descr:str="") -> pathlib.Path:
+		"""Adds a curve to the cached LAS file, or replaces the data of the curve with the
+		same mnemonic. The header is rewritten last, as in dump.
+
+		Returns:
+		-------
+		pathlib.Path: Path of the .npy file of the curve.
+		"""
+		with open(self.header,"r") as f:
+			header = json.load(f)
+
+		curves = header["sections"]["Curves"]
+
+		index = next((index for index,item in enumerate(curves) if item["mnemonic"]==mnemonic),len(curves))
+
+		numpy.save(self.curve(index),Cache.column(data))
+
+		if index==len(curves):
+			curves.append(dict(mnemonic=mnemonic,unit=unit,value="",descr=descr))
+
+		temp = self.header.with_suffix(".tmp")
+
+		with open(temp,"w") as f:
+			json.dump(header,f)
+
+		os.replace(temp,self.header)
+
+		return self.curve(index)
+
+	def curve(self,index:int) -> pathlib.Path:
+		"""Path of the .npy file for the curve at the given index."""
+		return self.folder / f"{index:04d}.npy"
+
+	@staticmethod
+	def column(data) -> numpy.ndarray:
+		"""Returns curve data as an array that numpy can memory-map."""
+		data = numpy.asarray(data)
+
+		return data.astype(str) if data.dtype == object else data
+
+	@staticmethod
+	def array(path:pathlib.Path,mmap_mode:str=None) -> numpy.ndarray:
+		"""Loads an .npy file, reading it into memory when it can not be mapped."""
+		try:
+			return numpy.load(path,mmap_mode=mmap_mode)
+		except ValueError:
+			return numpy.load(path)
+
+class Manifest():
+	"""Records the size, modification time and optional content hash of the source
+	LAS files of a cache directory, so that changed files can be detected."""
+
+	def __init__(self,cache):
+		"""Initializes the manifest of the cache directory, reading it if it exists."""
+		self.path = pathlib.Path(cache) / "manifest.json"
+
+		self.entries = {}
+
+		if self.path.exists():
+			with open(self.path,"r") as f:
+				self.entries = json.load(f)
+
+	def fresh(self,name:str,source:pathlib.Path,checksum:bool=False) -> bool:
+		"""Returns True if the cached version of the source file is up to date.
+
+		Parameters:
+		----------
+		name 	 : Name of the cached file (the stem of the source file).
+		source 	 : Path of the source LAS file.
+		checksum : If True, a file with the same size but a different modification
+				   time is compared by content hash before it is declared stale.
+		"""
+		entry = self.entries.get(name)
+
+		if entry is None:
+			return False
+
+		stat = source.stat()
+
+		if entry["size"] != stat.st_size:
+			return False
+
+		if entry["mtime"] == stat.st_mtime_ns:
+			return True
+
+		if not checksum or entry.get("hash") is None:
+			return False
+
+		if entry["hash"] != Manifest.digest(source):
+			return False
+
+		entry["mtime"] = stat.st_mtime_ns # re-delivered with the same content
+
+		return True
+
+	def record(self,name:str,source:pathlib.Path,checksum:bool=False):
+		"""Records the current state of the source file."""
+		self.entries[name] = Manifest.stamp(source,checksum)
+
+	def evict(self,name:str):
+		"""Removes the cached file and its manifest entry."""
+		shutil.rmtree(self.path.parent / name,ignore_errors=True)
+
+		self.entries.pop(name,None)
+
+	def save(self):
+		"""Writes the manifest to the cache directory."""
+		temp = self.path.with_suffix(".tmp")
+
+		with open(temp,"w") as f:
+			json.dump(self.entries,f,indent=1)
+
+		os.replace(temp,self.path)
+
+	@staticmethod
+	def stamp(source:pathlib.Path,checksum:bool=False) -> dict:
+		"""Returns the size, modification time and (optional) content hash of the file."""
+		stat = source.stat()
+
+		digest = Manifest.digest(source) if checksum else None
+
+		return dict(size=stat.st_size,mtime=stat.st_mtime_ns,hash=digest)
+
+	@staticmethod
+	def digest(source:pathlib.Path,blocksize:int=1<<20) -> str:
+		"""Returns the BLAKE2 hash of the file content."""
+		hasher = hashlib.blake2b(digest_size=16)
+
+		with open(source,"rb") as f:
+			for block in iter(lambda: f.read(blocksize),b""):
+				hasher.update(block)
+
+		return hasher.hexdigest()
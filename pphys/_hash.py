@@ -0,0 +1,37 @@
+import hashlib
+
+import numpy
+
+def fingerprint(*items,**named) -> str:
+	"""Returns a BLAKE2 hash of the items and of the keyword items. Arrays are hashed
+	by dtype, shape and content, dictionaries by their sorted items, lists and tuples
+	item by item, and anything else by its repr, so equal inputs give equal hashes
+	across runs."""
+	hasher = hashlib.blake2b(digest_size=16)
+
+	for item in items:
+		update(hasher,item)
+
+	if named:
+		update(hasher,named)
+
+	return hasher.hexdigest()
+
+def update(hasher,item):
+	"""Feeds an item to the hasher, see fingerprint."""
+	if isinstance(item,numpy.ndarray):
+		hasher.update(str((item.dtype,item.shape)).encode())
+		hasher.update(numpy.ascontiguousarray(item))
+	elif isinstance(item,dict):
+		hasher.update(b"{")
+		for key in sorted(item):
+			hasher.update(repr(key).encode()+b":")
+			update(hasher,item[key])
+		hasher.update(b"}")
+	elif isinstance(item,(list,tuple)):
+		hasher.update(b"[")
+		for value in item:
+			update(hasher,value)
+		hasher.update(b"]")
+	else:
+		hasher.update(repr(item).encode()+b",")
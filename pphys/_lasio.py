@@ -1,12 +1,66 @@
 import lasio
 import numpy
+import pandas
 
 class LASIO(lasio.LASFile):
 
-	def __init__(self,file_ref,**kwargs):
+	def __init__(self,file_ref=None,**kwargs):
 
 		super().__init__(file_ref,**kwargs)
 
+	def header(self) -> dict:
+		"""
+		Returns the header sections and curve definitions as a JSON-serializable dictionary.
+
+		Returns:
+		-------
+		dict: Section names as keys; item sections are lists of item dictionaries
+			  and text sections (e.g. ~Other) are strings.
+		"""
+		sections = {}
+
+		for name,section in self.sections.items():
+			if isinstance(section,lasio.SectionItems):
+				sections[name] = [LASIO.item(entry) for entry in section]
+			else:
+				sections[name] = section
+
+		return {"index_unit":self.index_unit,"sections":sections}
+
+	@classmethod
+	def assemble(cls,header:dict,arrays:list):
+		"""
+		Creates a LAS object from a header dictionary and curve arrays without
+		parsing any file. Arrays are attached as they are, so memory-mapped arrays
+		or views stay zero-copy.
+
+		Parameters:
+		----------
+		header (dict): Header dictionary in the format returned by the header method.
+		arrays (list): Curve arrays in the order of the ~Curves section.
+
+		Returns:
+		-------
+		LASIO: The LAS object.
+		"""
+		las = cls()
+
+		las.index_unit = header.get("index_unit")
+
+		for name,section in header["sections"].items():
+			if name == "Curves":
+				las.sections[name] = lasio.SectionItems([
+					lasio.CurveItem(**item,data=data) for item,data in zip(section,arrays)])
+			elif isinstance(section,list):
+				las.sections[name] = lasio.SectionItems([
+					lasio.HeaderItem(**item) for item in section])
+			else:
+				las.sections[name] = section
+
+		las.curves.assign_duplicate_suffixes()
+
+		return las
+
 	def mask(self,dmin:float=None,dmax:float=None):
 		"""
 		Selects a depth interval and returns a boolean array.
@@ -18,15 +72,42 @@ class LASIO(lasio.LASFile):
 		Returns:
 		np.ndarray: Boolean array where True indicates depths within the interval.
 		"""
+		if self.sorted:
+			mask = numpy.zeros(self.index.size,dtype=bool)
+			mask[self.bounds(dmin,dmax)] = True
+			return mask
+
 		dmin = self.index.min() if dmin is None else dmin
 		dmax = self.index.max() if dmax is None else dmax
 
 		return numpy.logical_and(self.index>=dmin,self.index<=dmax)
 
+	def bounds(self,dmin:float=None,dmax:float=None) -> slice:
+		"""
+		Selects a depth interval of a sorted index and returns it as a slice, so that
+		indexing with it gives views instead of copies. A uniform-step index is located
+		arithmetically in O(1), any other sorted index with searchsorted in O(log n).
+
+		Parameters:
+		dmin (float): Minimum depth of the interval.
+		dmax (float): Maximum depth of the interval.
+
+		Returns:
+		slice: Positions of the depths within the interval.
+		"""
+		if not self.sorted:
+			raise ValueError("The index of the LAS file is not sorted in increasing order.")
+
+		start = 0 if dmin is None else self._locate(dmin,"left")
+		stop = self.index.size if dmax is None else self._locate(dmax,"right")
+
+		return slice(start,max(start,stop))
+
 	def crop(self,dmin:float=None,dmax:float=None,key:str=None):
 		"""
 		Crops a LAS frame (or curve if key is provided) to include only data
-		within a specified depth range.
+		within a specified depth range. For a sorted index, the curves are sliced
+		so a cropped curve is a view of the LAS data.
 
 		Parameters:
 		----------
@@ -38,44 +119,221 @@ class LASIO(lasio.LASFile):
 		-------
 		numpy.ndarray or pandas.DataFrame: Cropped curve values.
 		"""
-		mask = self.mask(dmin,dmax)
+		rows = self.bounds(dmin,dmax) if self.sorted else self.mask(dmin,dmax)
+
+		if key is not None:
+			return self[key][rows]
+
+		return pandas.DataFrame(
+			{curve.mnemonic:curve.data[rows] for curve in self.curves[1:]},
+			index=pandas.Index(self.index[rows],name=self.curves[0].mnemonic),
+			copy=False)
+
+	@property
+	def sorted(self) -> bool:
+		"""True if the index is strictly increasing; the check is cached per index array."""
+		return self._sorting()[0]
+
+	def _sorting(self) -> tuple:
+		"""Returns (sorted, step) of the index, where step is the uniform spacing or None.
+		The result is recomputed only when the index array is replaced."""
+		index = self.index
+
+		cached = getattr(self,"_sorted_index",None)
+
+		if cached is not None and cached[0] is index:
+			return cached[1:]
+
+		issorted = bool(LASIO.is_sorted(index)) if index.size>1 else True
+
+		step = None
+
+		if issorted and index.size>1:
+			steps = numpy.diff(index)
+			if numpy.allclose(steps,steps.mean(),rtol=0,atol=1e-3*abs(steps.mean())):
+				step = float(steps.mean())
+
+		self._sorted_index = (index,issorted,step)
+
+		return issorted,step
+
+	def _locate(self,depth:float,side:str) -> int:
+		"""Returns the same position as numpy.searchsorted(index,depth,side). For a
+		uniform step, the position is estimated arithmetically and corrected by
+		walking over the few neighbouring samples."""
+		index = self.index
+
+		_,step = self._sorting()
+
+		if step is None:
+			return int(numpy.searchsorted(index,depth,side))
+
+		position = int(numpy.clip(numpy.ceil((depth-index[0])/step),0,index.size))
+
+		below = (lambda value: value<depth) if side=="left" else (lambda value: value<=depth)
 
-		return self.df()[mask] if key is None else self[key].values[mask]
+		while position>0 and not below(index[position-1]):
+			position -= 1
 
-	def resample(self,depths:numpy.ndarray,key:str=None):
+		while position<index.size and below(index[position]):
+			position += 1
+
+		return position
+
+	def resample(self,depths:numpy.ndarray,key:str=None,mode:str="linear"):
 		"""
-		Resample a curve's values based on new depth values.
+		Resample curve values based on new depth values. The bracketing indices and
+		weights are computed once for the new depths and applied to all curves as a
+		single matrix operation.
 
 		Parameters:
 		----------
-		depths (array-like): New depth values for resampling.
-		key (str): Name of the curve to resample.
+		depths (array-like): New depth values for resampling, in increasing order.
+		key (str): Name of the curve to resample, all curves are resampled if None.
+		mode (str): "linear" interpolation, "nearest" sample, or "average" of the samples
+			within each new depth interval (for decimation). NaN samples do not spread to
+			neighbours that carry no weight from them, and are skipped by "average".
+			Depths outside of the index range are NaN.
 
 		Returns:
 		-------
 		numpy.ndarray or pandas.DataFrame: Resampled curve values.
 		"""
-		interp = lambda values: numpy.interp(depths,self.index,values)
+		if mode not in ("linear","nearest","average"):
+			raise ValueError(f"Unsupported mode '{mode}', use 'linear', 'nearest' or 'average'.")
+
+		depths = numpy.asarray(depths,dtype=float)
+
+		if not self.sorted:
+			raise ValueError("The index of the LAS file is not sorted in increasing order.")
+
+		curves = self.curves[1:] if key is None else [self.curves[key]]
+
+		values = numpy.vstack([numpy.asarray(curve.data,dtype=float) for curve in curves])
+
+		resampled = getattr(LASIO,f"_{mode}")(self.index,values,depths)
+
+		if key is not None:
+			return resampled[0]
+
+		return pandas.DataFrame(resampled.T,
+			index=pandas.Index(depths,name=self.curves[0].mnemonic),
+			columns=[curve.mnemonic for curve in curves])
+
+	@staticmethod
+	def _brackets(index:numpy.ndarray,depths:numpy.ndarray) -> tuple:
+		"""Returns the left and right bracketing positions of depths in the sorted index,
+		the weights of the right positions and the mask of depths outside of the index."""
+		right = numpy.clip(numpy.searchsorted(index,depths,"right"),1,index.size-1)
+		left = right-1
+
+		weight = (depths-index[left])/(index[right]-index[left])
+
+		outside = numpy.logical_or(depths<index[0],depths>index[-1])
+
+		return left,right,weight,outside
+
+	@staticmethod
+	def _linear(index:numpy.ndarray,values:numpy.ndarray,depths:numpy.ndarray) -> numpy.ndarray:
+		"""Linear interpolation of all rows of values onto the depths."""
+		left,right,weight,outside = LASIO._brackets(index,depths)
+
+		lvalues,rvalues = values[:,left],values[:,right]
+
+		with numpy.errstate(invalid="ignore"):
+			resampled = lvalues*(1-weight)+rvalues*weight
+
+		resampled = numpy.where(weight==0,lvalues,resampled)
+		resampled = numpy.where(weight==1,rvalues,resampled)
+
+		resampled[:,outside] = numpy.nan
+
+		return resampled
+
+	@staticmethod
+	def _nearest(index:numpy.ndarray,values:numpy.ndarray,depths:numpy.ndarray) -> numpy.ndarray:
+		"""Nearest-sample resampling of all rows of values onto the depths."""
+		left,right,weight,outside = LASIO._brackets(index,depths)
+
+		resampled = values[:,numpy.where(weight<0.5,left,right)]
+
+		resampled[:,outside] = numpy.nan
+
+		return resampled
+
+	@staticmethod
+	def _average(index:numpy.ndarray,values:numpy.ndarray,depths:numpy.ndarray) -> numpy.ndarray:
+		"""Block average of all rows of values over the intervals centered at the depths,
+		bounded by the midpoints between consecutive depths."""
+		if depths.size<2:
+			return LASIO._linear(index,values,depths)
+
+		middle = (depths[1:]+depths[:-1])/2
+
+		edges = numpy.concatenate((
+			[depths[0]-(middle[0]-depths[0])],middle,[depths[-1]+(depths[-1]-middle[-1])]))
+
+		positions = numpy.searchsorted(index,edges,"left")
+
+		finite = numpy.isfinite(values)
+
+		sums = numpy.zeros((values.shape[0],index.size+1))
+		counts = numpy.zeros((values.shape[0],index.size+1))
+
+		numpy.cumsum(numpy.where(finite,values,0),axis=1,out=sums[:,1:])
+		numpy.cumsum(finite,axis=1,out=counts[:,1:])
+
+		total = sums[:,positions[1:]]-sums[:,positions[:-1]]
+		count = counts[:,positions[1:]]-counts[:,positions[:-1]]
+
+		with numpy.errstate(invalid="ignore",divide="ignore"):
+			return numpy.where(count>0,total/count,numpy.nan)
+
+	def copy(self,dmin:float=None,dmax:float=None,keys:list=None):
+		"""
+		Creates a new LAS object for a depth window and/or a subset of curves.
+		The headers are copied; the curves are views of this object's data when the
+		index is sorted, so splitting a well into zones allocates no curve memory.
+		Editing the values of such a copy edits this object as well.
 
-		return self.df.apply(interp) if key is None else interp(self[key])
+		Parameters:
+		----------
+		dmin (float): Minimum depth of the window.
+		dmax (float): Maximum depth of the window.
+		keys (list): Names of the curves to keep, all curves are kept if None.
+			The index curve is always kept.
+
+		Returns:
+		-------
+		LASIO: The new LAS object with STRT and STOP set to the window limits.
+		"""
+		rows = self.bounds(dmin,dmax) if self.sorted else self.mask(dmin,dmax)
 
-	def copy(self):
-		"""Create a new LAS object with the cropped data"""
-		las = lasio.LASFile()
+		keys = [keys] if isinstance(keys,str) else keys
 
-		las.index = cropped_data.index  # Set the new depth index
+		selected = [index for index,curve in enumerate(self.curves)
+			if index==0 or keys is None or curve.mnemonic in keys]
 
-		for curve in self.curves:
-			if curve.mnemonic in cropped_data.columns:
-				las.add_curve(
-					curve.mnemonic,
-					cropped_data[curve.mnemonic].values,
-					unit=curve.unit,
-					descr=curve.descr,
-				)
+		header = self.header()
+
+		header["sections"]["Curves"] = [header["sections"]["Curves"][index] for index in selected]
+
+		las = type(self).assemble(header,[self.curves[index].data[rows] for index in selected])
+
+		if las.index.size>0:
+			for mnemonic,value in zip(("STRT","STOP"),(las.index[0],las.index[-1])):
+				if mnemonic in las.well:
+					las.well[mnemonic].value = float(value)
 
 		return las
 
+	@staticmethod
+	def item(entry) -> dict:
+		"""Returns the mnemonic, unit, value and description of a header item."""
+		value = entry.value.item() if isinstance(entry.value,numpy.generic) else entry.value
+
+		return dict(mnemonic=entry.original_mnemonic,unit=entry.unit,value=value,descr=entry.descr)
+
 	@staticmethod
 	def is_valid(values:numpy.ndarray):
 		return numpy.all(~numpy.isnan(values))
@@ -1,43 +1,213 @@
-import os
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from concurrent.futures import ProcessPoolExecutor
+
+from dataclasses import dataclass, field
+
 import pathlib
-import pickle
 
-from ._lasio import LASIO
+from ._cache import Cache, Manifest
+from ._pool import bounded
+from ._read import read
+
+@dataclass
+class Report:
+	"""Lists the LAS files reused from the cache, rebuilt from source and evicted
+	from the cache during a single load call."""
+	reused 	: list = field(default_factory=list)
+	rebuilt : list = field(default_factory=list)
+	evicted : list = field(default_factory=list)
+
+def load(path:str,cache:str,engine:str=None,mmap_mode:str="r",checksum:bool=False,report:bool=False,workers:int=None,lazy:bool=False,budget:int=None):
+	"""Load LAS files from a directory, using a columnar cache to avoid redundant processing.
+	Only new or changed files are parsed; cached files whose source was deleted are evicted.
 
-def load(path:str,cache:str) -> dict:
-	"""Load LAS files from a directory, using a cache to avoid redundant processing.
-	
 	Parameters:
 	----------
-	path  : Directory containing LAS files.
-	cache : Directory where cached files will be stored.
+	path  	  : Directory containing LAS files.
+	cache 	  : Directory where cached files will be stored, one folder per LAS file
+				with a .npy file per curve and a JSON header.
+	engine	  : Reader engine used for files that are parsed, see pphys.read.
+	mmap_mode : Memory-map mode for the cached curves, see numpy.load.
+	checksum  : If True, content hashes are recorded in the cache manifest and files
+				that only changed modification time are compared by content.
+	report 	  : If True, a Report of reused, rebuilt and evicted files is returned as well.
+	workers   : Number of processes parsing and caching files in parallel. The workers
+				write to the cache and only return small manifest entries, the parent
+				then memory-maps the results in sorted filename order.
+	lazy 	  : If True, a Field mapping is returned instead of a dictionary; wells are
+				parsed or loaded from the cache on first access.
+	budget 	  : Upper limit in bytes for the curve data kept by the lazy Field. The least
+				recently used wells are released when the limit is exceeded.
 
 	Returns:
 	-------
-	dict: A dictionary with filenames (without extension) as keys and LAS data as values.
+	dict: A dictionary with filenames (without extension) as keys and LAS data as values,
+		  or a Field mapping if lazy is True.
+	Report: Returned only if report is True.
 	"""
 
 	# Ensure cache directory exists
-	# os.makedirs(cache,exist_ok=True)
 	pathlib.Path(cache).mkdir(parents=True, exist_ok=True)
 
+	manifest = Manifest(cache) # Source file sizes, modification times and hashes
+
+	summary = Report()
+
 	las_files = {}  # Dictionary to store LAS data
 
-	# Loop through all .las files in the directory
-	for las_file in pathlib.Path(path).glob("*.las"):
-		cache_file = pathlib.Path(cache) / f"{las_file.stem}.pkl"  # Cache filename
+	sources = {las_file.stem:las_file for las_file in sorted(pathlib.Path(path).glob("*.las"))}
+
+	# Evict cached files whose source no longer exists
+	for name in sorted(set(manifest.entries)-set(sources)):
+		manifest.evict(name)
+		summary.evicted.append(name)
+
+	if lazy:
+		manifest.save()
+		wells = Field(sources,cache,manifest,summary,engine,mmap_mode,checksum,budget)
+		return (wells,summary) if report else wells
+
+	# Collect new or changed files, reuse the cached version of the others
+	stale = []
+
+	for name,las_file in sources.items():
+		if Cache(pathlib.Path(cache) / name).exists() and manifest.fresh(name,las_file,checksum):
+			summary.reused.append(name)
+		else:
+			stale.append(name)
+
+	# Read and cache the stale LAS files, in parallel if workers are given
+	jobs = [(str(sources[name]),str(pathlib.Path(cache) / name),engine,checksum) for name in stale]
+
+	for name,stamp in zip(stale,rebuild(jobs,workers)):
+		manifest.entries[name] = stamp
+		summary.rebuilt.append(name)
+
+	# Store in dictionary with filename as key, curves are memory-mapped
+	for name in sources:
+		las_files[name] = Cache(pathlib.Path(cache) / name).load(mmap_mode)
+
+	manifest.save()
+
+	if report:
+		return las_files,summary
+
+	return las_files  # Dictionary of {filename: LASIO}
+
+class Field(Mapping):
+	"""Lazy mapping of the LAS files in a directory. Keys come from the directory
+	listing; a well is parsed or loaded from the cache on first access and kept in
+	a least-recently-used store bounded by a byte budget, so iterating over the whole
+	field runs in constant memory."""
+
+	def __init__(self,sources:dict,cache:str,manifest:Manifest,summary:Report,engine:str=None,mmap_mode:str="r",checksum:bool=False,budget:int=None):
+
+		self._sources = sources
+
+		self._cache = pathlib.Path(cache)
+
+		self._manifest = manifest
+		self._summary = summary
+
+		self._engine = engine
+		self._mmap_mode = mmap_mode
+		self._checksum = checksum
+
+		self._budget = budget
+
+		self._wells = OrderedDict() # least recently used wells come first
+		self._sizes = {}
 
-		# If a cached version exists, load it
-		if cache_file.exists():
-			with open(cache_file, "rb") as f:
-				las_data = pickle.load(f)
+	def __getitem__(self,name:str):
+
+		if name in self._wells:
+			self._wells.move_to_end(name)
+			return self._wells[name]
+
+		source = self._sources[name]
+
+		folder = Cache(self._cache / name)
+
+		if folder.exists() and self._manifest.fresh(name,source,self._checksum):
+			entries = self._summary.reused
+		else:
+			self._manifest.entries[name] = build(str(source),str(folder.folder),self._engine,self._checksum)
+			self._manifest.save()
+			entries = self._summary.rebuilt
+
+		if name not in entries:
+			entries.append(name)
+
+		las = folder.load(self._mmap_mode)
+
+		self._wells[name] = las
+		self._sizes[name] = sum(curve.data.nbytes for curve in las.curves)
+
+		self.shrink()
+
+		return las
+
+	def __iter__(self):
+		return iter(self._sources)
+
+	def __len__(self):
+		return len(self._sources)
+
+	def __contains__(self,name):
+		return name in self._sources
+
+	def write(self,name:str,mnemonic:str,data,unit:str="",descr:str=""):
+		"""Adds or replaces a curve of a well in its cache folder, so that the curve
+		survives the release of the well from memory. A loaded well gets the curve too."""
+		path = Cache(self._cache / name).write(mnemonic,data,unit,descr)
+
+		if name not in self._wells:
+			return
+
+		las = self._wells[name]
+
+		if mnemonic in las.keys():
+			las[mnemonic] = Cache.array(path,self._mmap_mode)
 		else:
-			# Otherwise, read and cache the LAS file
-			las_data = LASIO(str(las_file))
-			with open(cache_file, "wb") as f:
-				pickle.dump(las_data,f)
+			las.append_curve(mnemonic,Cache.array(path,self._mmap_mode),unit=unit,descr=descr)
+
+		self._sizes[name] = sum(curve.data.nbytes for curve in las.curves)
+
+	def shrink(self):
+		"""Releases the least recently used wells until the byte budget is met.
+		The most recently accessed well is always kept."""
+		if self._budget is None:
+			return
+
+		while len(self._wells)>1 and self.nbytes>self._budget:
+			name,_ = self._wells.popitem(last=False)
+			self._sizes.pop(name)
+
+	@property
+	def nbytes(self) -> int:
+		"""Total bytes of curve data held by the loaded wells."""
+		return sum(self._sizes.values())
+
+def build(source:str,folder:str,engine:str=None,checksum:bool=False) -> dict:
+	"""Reads a LAS file, writes it to its cache folder and returns its manifest entry."""
+	stamp = Manifest.stamp(pathlib.Path(source),checksum)
+
+	Cache(folder).dump(read(source,engine=engine))
+
+	return stamp
+
+def rebuild(jobs:list,workers:int=None) -> list:
+	"""Runs the build jobs and returns their manifest entries in the order of jobs.
+	With workers, jobs run in a process pool with at most twice as many jobs in flight."""
+	if workers is None or workers<=1 or len(jobs)<=1:
+		return [build(*job) for job in jobs]
+
+	stamps = [None]*len(jobs)
 
-		# Store in dictionary with filename as key
-		las_files[las_file.stem] = las_data
+	with ProcessPoolExecutor(max_workers=workers) as executor:
+		for index,stamp in bounded(executor,build,jobs,2*workers):
+			stamps[index] = stamp
 
-	return las_files  # Dictionary of {filename: LASFile}
\ No newline at end of file
+	return stamps
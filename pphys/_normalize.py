@@ -0,0 +1,266 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import json
+import os
+import pathlib
+
+import numpy
+
+from ._hash import fingerprint
+from ._pool import bounded
+from ._zoning import label, group
+
+class Normalize():
+	"""Field-wide log normalization to a type-well. The quantiles of a curve are
+	computed per well and per zone in one sorting pass, a linear or quantile-mapping
+	transform is fitted for each zone onto the quantiles of the type-well, and the
+	transforms are applied to all wells as a new curve.
+
+	The fitted transforms are cached with a content hash of each well's curve, depths
+	and zone tops (and of the type-well), so a re-run only refits and rewrites the wells
+	that changed. With a cache path, the transforms are kept in a JSON file across runs.
+
+	Example:
+	-------
+	norm = Normalize("GR",typewell="WELL-01",zones=tops,cache="cache/gr_norm.json",workers=8)
+
+	norm.run(wells)  # adds GR_NORM to every well, returns the updated well names
+	"""
+
+	def __init__(self,key:str,typewell:str,method:str="linear",quantiles:tuple=None,zones=None,suffix:str="_NORM",cache:str=None,workers:int=None):
+		"""Initializes the normalization.
+
+		Parameters:
+		----------
+		key 	  : Mnemonic of the curve to normalize, e.g. "GR", "NPHI" or "RHOB".
+		typewell  : Name of the reference well in the field mapping.
+		method 	  : "linear" fits a gain and an offset to the quantile pairs by least
+					squares; "quantile" maps the quantiles piecewise-linearly onto the
+					type-well quantiles (histogram matching).
+		quantiles : Probabilities of the matched quantiles; (0.05,0.95) for "linear" and
+					21 values from 0.02 to 0.98 for "quantile" by default.
+		zones 	  : hopper.Zones shared by all wells, or a mapping of well names to their
+					Zones; samples outside the zones are left unchanged. If None, each
+					well is a single zone.
+		suffix 	  : Suffix of the mnemonic of the normalized curve.
+		cache 	  : Path of the JSON file keeping the fitted transforms across runs.
+		workers   : Number of threads processing wells in parallel.
+		"""
+		if method not in ("linear","quantile"):
+			raise ValueError(f"Unsupported method '{method}', use 'linear' or 'quantile'.")
+
+		if quantiles is None:
+			quantiles = (0.05,0.95) if method=="linear" else tuple(numpy.linspace(0.02,0.98,21))
+
+		self.key = key
+		self.typewell = typewell
+
+		self.method = method
+
+		self.quantiles = numpy.asarray(quantiles,dtype=float)
+
+		self.zones = zones
+		self.suffix = suffix
+
+		self.path = None if cache is None else pathlib.Path(cache)
+
+		self.workers = workers
+
+		self.entries = {} # well name -> fingerprint, reference and transforms
+
+		if self.path is not None and self.path.exists():
+			with open(self.path,"r") as f:
+				self.entries = json.load(f)
+
+	def run(self,wells) -> list:
+		"""Fits and applies the transforms to the wells, a dict or a Field of LASIO.
+		Wells whose data and reference did not change since the last run, and that
+		already hold the normalized curve, are not touched.
+
+		In a Field, the normalized curve is written to the well's cache folder (see
+		Field.write), so it is kept when the well is released from memory. Wells are
+		fetched and stored in the calling thread, with at most twice as many wells as
+		workers in flight, so the byte budget of a lazy Field is respected.
+
+		Returns:
+		-------
+		list: Names of the wells whose normalized curve was (re)written.
+		"""
+		reference = self.statistics(wells[self.typewell],self.zoning(self.typewell))
+
+		refhash = fingerprint(reference,self.quantiles,self.method)
+
+		mnemonic = self.key+self.suffix
+
+		def process(name,las):
+
+			zones = self.zoning(name)
+
+			digest = fingerprint(las[self.key],las.index,self.key,
+				None if zones is None else [zones.keys,zones.tops])
+
+			entry = self.entries.get(name)
+
+			if entry is None or entry["fingerprint"]!=digest or entry["reference"]!=refhash:
+				transforms = self.fit(self.statistics(las,zones),reference)
+				entry = dict(fingerprint=digest,reference=refhash,transforms=transforms)
+			elif mnemonic in las.keys():
+				return name,entry,None,None
+
+			values = self.transform(las[self.key],las.index,zones,entry["transforms"])
+
+			return name,entry,values,las.curves[self.key].unit
+
+		entries,updated = {},[]
+
+		def store(name,entry,values,unit):
+
+			entries[name] = entry
+
+			if values is None:
+				return
+
+			descr = f"{self.key} normalized to {self.typewell}"
+
+			if hasattr(wells,"write"):
+				wells.write(name,mnemonic,values,unit=unit,descr=descr)
+			elif mnemonic in wells[name].keys():
+				wells[name][mnemonic] = values
+			else:
+				wells[name].append_curve(mnemonic,values,unit=unit,descr=descr)
+
+			updated.append(name)
+
+		if self.workers is None or self.workers<=1:
+			for name in wells:
+				store(*process(name,wells[name]))
+		else:
+			with ThreadPoolExecutor(max_workers=self.workers) as executor:
+				jobs = ((name,wells[name]) for name in wells)
+				for _,result in bounded(executor,process,jobs,2*self.workers):
+					store(*result)
+
+		self.entries = {name:entries[name] for name in wells}
+
+		self.save()
+
+		return [name for name in wells if name in updated]
+
+	def statistics(self,las,zones) -> dict:
+		"""Returns the quantiles of the curve for each zone (zone names as keys) from a
+		single sort of the samples by zone and value."""
+		values = numpy.asarray(las[self.key],dtype=float)
+
+		labels,keys = label(zones,las.index,values.size)
+
+		valid = numpy.logical_and(numpy.isfinite(values),labels>=0)
+
+		values,labels = values[valid],labels[valid]
+
+		if values.size==0:
+			return {key:[numpy.nan]*self.quantiles.size for key in keys}
+
+		order,starts = group(labels,len(keys),values)
+
+		values = values[order]
+
+		counts,starts = numpy.diff(starts),starts[:-1]
+
+		# linear interpolation between the order statistics, as in numpy.quantile
+		position = starts[:,None]+self.quantiles[None,:]*numpy.maximum(counts-1,0)[:,None]
+
+		lower = numpy.floor(position).astype(int)
+		upper = numpy.minimum(lower+1,starts[:,None]+numpy.maximum(counts-1,0)[:,None])
+
+		lower,upper = numpy.minimum(lower,values.size-1),numpy.minimum(upper,values.size-1)
+
+		table = values[lower]+(position-lower)*(values[upper]-values[lower])
+
+		table[counts==0] = numpy.nan
+
+		return {key:row.tolist() for key,row in zip(keys,table)}
+
+	def fit(self,statistics:dict,reference:dict) -> dict:
+		"""Returns the transform of each zone mapping the well quantiles onto the
+		type-well quantiles; zones missing in either are left out."""
+		transforms = {}
+
+		for key,source in statistics.items():
+
+			source = numpy.asarray(source)
+			target = numpy.asarray(reference.get(key,[numpy.nan]*source.size))
+
+			valid = numpy.logical_and(numpy.isfinite(source),numpy.isfinite(target))
+
+			if numpy.count_nonzero(valid)<2 or numpy.ptp(source[valid])==0:
+				continue
+
+			if self.method=="linear":
+				gain,offset = numpy.polyfit(source[valid],target[valid],1)
+				transforms[key] = [float(gain),float(offset)]
+			else:
+				# the knots must increase for numpy.interp
+				target = numpy.maximum.accumulate(target[valid])
+				source,index = numpy.unique(source[valid],return_index=True)
+				transforms[key] = [source.tolist(),target[index].tolist()]
+
+		return transforms
+
+	def transform(self,values,depths,zones,transforms:dict) -> numpy.ndarray:
+		"""Applies the zone transforms to the curve and returns the normalized values."""
+		values = numpy.asarray(values,dtype=float)
+
+		labels,keys = label(zones,depths,values.size)
+
+		result = values.copy()
+
+		for index,key in enumerate(keys):
+
+			if key not in transforms:
+				continue
+
+			mask = labels==index
+
+			if self.method=="linear":
+				gain,offset = transforms[key]
+				result[mask] = gain*values[mask]+offset
+			else:
+				result[mask] = Normalize.interp(values[mask],*map(numpy.asarray,transforms[key]))
+
+		return result
+
+	def zoning(self,name:str):
+		"""Returns the Zones of the well, None if wells are not zoned."""
+		if self.zones is None or hasattr(self.zones,"locate"):
+			return self.zones
+
+		return self.zones.get(name)
+
+	def save(self):
+		"""Writes the fitted transforms to the cache file, if any."""
+		if self.path is None:
+			return
+
+		self.path.parent.mkdir(parents=True,exist_ok=True)
+
+		temp = self.path.with_suffix(".tmp")
+
+		with open(temp,"w") as f:
+			json.dump(self.entries,f)
+
+		os.replace(temp,self.path)
+
+	@staticmethod
+	def interp(values,source,target):
+		"""Piecewise-linear quantile mapping, extrapolated with the end segments."""
+		if source.size<2:
+			return values+(target[0]-source[0])
+
+		mapped = numpy.interp(values,source,target)
+
+		below,above = values<source[0],values>source[-1]
+
+		mapped[below] = target[0]+(values[below]-source[0])*(target[1]-target[0])/(source[1]-source[0])
+		mapped[above] = target[-1]+(values[above]-source[-1])*(target[-1]-target[-2])/(source[-1]-source[-2])
+
+		return mapped
@@ -0,0 +1,20 @@
+from concurrent.futures import FIRST_COMPLETED, wait
+
+def bounded(executor,function,jobs,limit:int):
+	"""Submits function(*job) for each job to the executor with at most limit jobs in
+	flight, and yields (index,result) pairs in the order of completion. The jobs are
+	consumed lazily in the calling thread, so a job is only created (e.g. a well only
+	loaded) once there is room for it."""
+	pending = {}
+
+	for index,job in enumerate(jobs):
+
+		if len(pending) >= limit:
+			done,_ = wait(pending,return_when=FIRST_COMPLETED)
+			for future in done:
+				yield pending.pop(future),future.result()
+
+		pending[executor.submit(function,*job)] = index
+
+	for future,index in pending.items():
+		yield index,future.result()
@@ -1,5 +1,108 @@
+import re
+import warnings
+
+import numpy
+
 from ._lasio import LASIO
 
-def read(file_ref,**kwargs):
+ASCII = re.compile(rb"^~A[^\n]*\n?",re.MULTILINE|re.IGNORECASE)
+
+def read(file_ref,engine:str=None,**kwargs):
+	"""Reads a LAS file and returns a LASIO object.
+
+	Parameters:
+	----------
+	file_ref : Path, file object or string content of the LAS file.
+	engine   : "fast" scans the header sections once and converts the whole ~A
+			   block into a 2D float array in one bulk NumPy call. Any other value
+			   is passed to lasio as its own data-section engine.
+
+	Returns:
+	-------
+	LASIO: The LAS object with the curve data.
+	"""
+	if engine == "fast":
+		return fast(file_ref,**kwargs)
+
+	if engine is not None:
+		kwargs["engine"] = engine
+
+	return LASIO(file_ref,**kwargs)
+
+def fast(file_ref,**kwargs):
+	"""Reads a LAS file by parsing the header with lasio and the ~A section with
+	a single numpy.fromstring call. Wrapped files, non-space delimiters and data
+	sections that are not purely numeric fall back to the lasio parser."""
+	content = readbytes(file_ref)
+
+	header,data = split(content)
+
+	if data is None:
+		return LASIO(decode(content,kwargs),**kwargs)
+
+	las = LASIO(decode(header,kwargs),ignore_data=True,**kwargs)
+
+	values = parse(data,las)
+
+	if values is None:
+		return LASIO(decode(content,kwargs),**kwargs)
+
+	for curve,column in zip(las.curves,values):
+		curve.data = column
+
+	return las
+
+def readbytes(file_ref) -> bytes:
+	"""Returns the raw content of a LAS file given as path, file object or string."""
+	if hasattr(file_ref,"read"):
+		content = file_ref.read()
+	elif isinstance(file_ref,str) and "\n" in file_ref:
+		content = file_ref
+	else:
+		with open(file_ref,"rb") as f:
+			content = f.read()
+
+	return content.encode() if isinstance(content,str) else content
+
+def split(content:bytes) -> tuple:
+	"""Splits LAS content into the header (including the ~A line) and the data section.
+	The data section is None when the content has no ~A line."""
+	match = ASCII.search(content)
+
+	if match is None:
+		return content,None
+
+	return content[:match.end()],content[match.end():]
+
+def parse(data:bytes,las:LASIO):
+	"""Converts the ~A section into a column-major float array with one row per curve.
+	Returns None when the section can not be read by the bulk conversion."""
+	if "WRAP" in las.version and str(las.version["WRAP"].value).upper().startswith("Y"):
+		return None
+
+	if "DLM" in las.version and str(las.version["DLM"].value).upper() not in ("","SPACE"):
+		return None
+
+	if not data.strip():
+		return None
+
+	with warnings.catch_warnings():
+		warnings.simplefilter("error")
+		try:
+			values = numpy.fromstring(data,dtype=float,sep=" ")
+		except (DeprecationWarning,ValueError):
+			return None
+
+	if len(las.curves)==0 or values.size%len(las.curves)!=0:
+		return None
+
+	values = numpy.ascontiguousarray(values.reshape((-1,len(las.curves))).T)
+
+	if "NULL" in las.well:
+		values[values==las.well["NULL"].value] = numpy.nan
+
+	return values
 
-	return LASIO(file_ref,**kwargs)
\ No newline at end of file
+def decode(content:bytes,kwargs:dict) -> str:
+	"""Decodes raw LAS content using the encoding passed to lasio, if any."""
+	return content.decode(kwargs.get("encoding") or "utf-8",errors="replace")
@@ -0,0 +1,117 @@
+import pathlib
+import re
+
+import pandas
+
+LINE = re.compile(r"^\s*([^.]*?)\s*\.(\S*)\s*(.*):([^:]*)$")
+
+def scan(path,pattern:str="*.las",curves:tuple=None) -> pandas.DataFrame:
+	"""Scans the header sections of LAS files without reading their data sections.
+	Each file is read line by line until the ~A section, so the cost does not depend
+	on the size of the data section.
+
+	Parameters:
+	----------
+	path 	: Directory containing LAS files, a single file or a list of files.
+	pattern : Filename pattern used when path is a directory.
+	curves 	: Curve mnemonics that must all be present; other files are dropped.
+
+	Returns:
+	-------
+	pandas.DataFrame: One row per file with the columns NAME, FILE, STRT, STOP, STEP,
+		NULL, UNIT (depth unit), CURVES and UNITS (tuples of curve mnemonics and units),
+		followed by the ~Well items and the ~Parameter items (prefixed with "P:").
+	"""
+	if isinstance(path,(str,pathlib.Path)) and pathlib.Path(path).is_dir():
+		files = sorted(pathlib.Path(path).glob(pattern))
+	elif isinstance(path,(str,pathlib.Path)):
+		files = [pathlib.Path(path)]
+	else:
+		files = [pathlib.Path(item) for item in path]
+
+	required = set() if curves is None else {curve.upper() for curve in curves}
+
+	rows = []
+
+	for las_file in files:
+
+		sections = header(las_file)
+
+		mnemonics = tuple(item[0] for item in sections["C"])
+
+		if not required.issubset(mnemonics):
+			continue
+
+		row = dict(
+			NAME = las_file.stem,
+			FILE = str(las_file),
+			STRT = None, STOP = None, STEP = None, NULL = None, UNIT = None,
+			CURVES = mnemonics,
+			UNITS = tuple(item[1] for item in sections["C"]),
+			)
+
+		for mnemonic,unit,value,_ in sections["W"]:
+			if mnemonic in ("STRT","STOP","STEP","NULL"):
+				row[mnemonic] = number(value)
+				if mnemonic == "STRT":
+					row["UNIT"] = unit
+			else:
+				row[mnemonic] = value
+
+		for mnemonic,_,value,_ in sections["P"]:
+			row[f"P:{mnemonic}"] = number(value)
+
+		rows.append(row)
+
+	return pandas.DataFrame(rows)
+
+def header(file_ref) -> dict:
+	"""Reads the header sections of a LAS file, stopping at the ~A line.
+
+	Returns:
+	-------
+	dict: Section letters ("V","W","C","P") as keys and lists of (mnemonic, unit,
+		  value, description) tuples as values.
+	"""
+	with open(file_ref,"rb") as f:
+		return sections(f)
+
+def sections(f) -> dict:
+	"""Reads header sections from a binary file object up to and including the ~A line,
+	leaving the file positioned at the start of the data section."""
+	items = {"V":[],"W":[],"C":[],"P":[]}
+
+	section = None
+
+	for raw in iter(f.readline,b""):
+		line = raw.decode("utf-8",errors="replace").strip()
+
+		if not line or line.startswith("#"):
+			continue
+
+		if line.startswith("~"):
+			section = line[1:2].upper()
+			if section == "A":
+				break
+			continue
+
+		if section not in items:
+			continue
+
+		match = LINE.match(line)
+
+		if match is None:
+			continue
+
+		mnemonic,unit,value,descr = match.groups()
+
+		items[section].append((mnemonic.upper(),unit,value.strip(),descr.strip()))
+
+	return items
+
+def number(value:str):
+	"""Returns the value as float if possible, otherwise the value itself."""
+	try:
+		return float(value)
+	except ValueError:
+		return value
@@ -0,0 +1,121 @@
+import warnings
+
+import numpy
+
+from ._scan import number, sections
+
+def windows(file_ref,size:int=100_000,dmin:float=None,dmax:float=None,blocksize:int=1<<22):
+	"""Reads the ~A section of a LAS file incrementally and yields fixed-size depth
+	windows as 2D arrays of shape (samples, curves). Memory is bounded by the window
+	and block sizes, not by the size of the file.
+
+	Parameters:
+	----------
+	file_ref  : Path of the LAS file.
+	size 	  : Number of depth samples in each window; the last window may be shorter.
+	dmin 	  : Minimum depth, samples above it are skipped.
+	dmax 	  : Maximum depth, samples below it are skipped. For increasing depths
+				(STEP>0) reading stops once dmax is passed; for decreasing depths
+				(STEP<0) it stops once dmin is passed.
+	blocksize : Number of bytes read from the file at a time.
+
+	Yields:
+	------
+	numpy.ndarray: Window of float values with NULL values replaced by NaN. Wrapped
+		files are supported since rows are rebuilt from the flat value stream.
+
+	Raises:
+	------
+	ValueError: If the ~C section defines no curves.
+	"""
+	with open(file_ref,"rb") as f:
+
+		items = sections(f)
+
+		ncurves = len(items["C"])
+
+		if ncurves==0:
+			raise ValueError("The LAS file has no curves in the ~C section.")
+
+		well = {mnemonic:number(value) for mnemonic,_,value,_ in items["W"]}
+
+		null,step = well.get("NULL"),well.get("STEP",0)
+
+		step = step if isinstance(step,float) else 0.
+
+		dmin = -numpy.inf if dmin is None else dmin
+		dmax = +numpy.inf if dmax is None else dmax
+
+		pending,npending = [],0
+
+		leftover,carry = numpy.empty(0),b""
+
+		while True:
+
+			block = f.read(blocksize)
+
+			text,carry = split(carry+block) if block else (carry,b"")
+
+			values = numpy.concatenate((leftover,convert(text)))
+
+			nrows = values.size//ncurves
+
+			leftover = values[nrows*ncurves:]
+
+			rows = values[:nrows*ncurves].reshape((nrows,ncurves))
+
+			if null is not None:
+				rows[rows==null] = numpy.nan
+
+			passed = nrows>0 and ((step>0 and rows[-1,0]>dmax) or (step<0 and rows[-1,0]<dmin))
+
+			rows = rows[numpy.logical_and(rows[:,0]>=dmin,rows[:,0]<=dmax)]
+
+			pending.append(rows)
+			npending += rows.shape[0]
+
+			while npending>=size:
+				stacked = numpy.concatenate(pending)
+				yield stacked[:size]
+				pending,npending = [stacked[size:]],npending-size
+
+			if passed or not block:
+				break
+
+		if npending>0:
+			yield numpy.concatenate(pending)
+
+def window(file_ref,dmin:float=None,dmax:float=None,**kwargs) -> numpy.ndarray:
+	"""Crop-style read of a depth interval from a LAS file without loading the rest
+	of the data section. Reading stops once the interval is passed.
+
+	Returns:
+	-------
+	numpy.ndarray: Values within the interval, shape (samples, curves); no samples
+		if the interval holds none.
+	"""
+	blocks = list(windows(file_ref,dmin=dmin,dmax=dmax,**kwargs))
+
+	if blocks:
+		return numpy.concatenate(blocks)
+
+	with open(file_ref,"rb") as f:
+		return numpy.empty((0,len(sections(f)["C"])))
+
+def split(content:bytes) -> tuple:
+	"""Splits content at its last line break into complete lines and the remainder."""
+	cut = content.rfind(b"\n")+1
+
+	return content[:cut],content[cut:]
+
+def convert(text:bytes) -> numpy.ndarray:
+	"""Converts whitespace-separated numbers into a flat float array."""
+	if not text.strip():
+		return numpy.empty(0) # numpy.fromstring returns [-1.] for blank text
+
+	with warnings.catch_warnings():
+		warnings.simplefilter("error")
+		try:
+			return numpy.fromstring(text,dtype=float,sep=" ")
+		except (DeprecationWarning,ValueError):
+			raise ValueError("The ~A section contains values that are not numbers.")
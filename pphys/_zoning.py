@@ -0,0 +1,27 @@
+import numpy
+
+def label(zones,depths=None,size:int=None):
+	"""Returns the zone index of each sample and the zone names. If zones (hopper.Zones)
+	is None, all samples are in a single zone named "all"; otherwise the samples above
+	the first top are labeled -1.
+
+	size : number of samples when zones is None, the length of depths by default
+	"""
+	if zones is None:
+		return numpy.zeros(len(depths) if size is None else size,dtype=int),["all"]
+
+	return zones.locate(numpy.asarray(depths,dtype=float)),list(zones.keys)
+
+def group(labels,count:int,values=None):
+	"""Sorts the samples by label, and by value within each label if values are given,
+	and returns the sort order and the bounds of the groups: the samples labeled i are
+	order[starts[i]:starts[i+1]]. Samples labeled -1 come before starts[0] and are left
+	out; NaN values are sorted to the end of their group."""
+	labels = numpy.asarray(labels)
+
+	if values is None:
+		order = numpy.argsort(labels,kind="stable")
+	else:
+		order = numpy.lexsort((values,labels))
+
+	return order,numpy.searchsorted(labels[order],numpy.arange(count+1))
@@ -1,3 +1,5 @@
+import numpy
+
 class Zones():
     """A class to store and utilize formation tops across the geom."""
 
@@ -28,6 +30,32 @@ class Zones():
     def limit(self,key):
         """Returns the list of formation tops and bottoms based on formation name."""
         return self.tops[self.index(key)], self.tops[self.index(key)+1]
+
+    def locate(self,depths):
+        """Returns the formation index of each depth, -1 for depths above the first top.
+        Depths below the last top belong to the last formation."""
+        return numpy.searchsorted(numpy.asarray(self.tops,dtype=float),depths,side="right")-1
+
+    def spread(self,depths,table,default=numpy.nan):
+        """Maps a per-formation parameter table to the depths, so that a model can be
+        evaluated for the whole well in one vectorized call.
+
+        depths  : depth values of the samples
+        table   : mapping of formation names to parameter values (e.g. dict or
+                  pandas.Series); scalars are returned unchanged
+        default : value of the samples outside of the formations in the table
+        """
+        if not hasattr(table,"get"):
+            return table
+
+        values = numpy.array([table.get(key,default) for key in self.keys]+[default],dtype=float)
+
+        return values[self.locate(depths)] # index -1 selects the default
+
+    def params(self,depths,**tables):
+        """Returns a dictionary of per-sample parameter arrays from per-formation tables,
+        e.g. zones.params(depths,a={"A":1.},m={"A":1.8,"B":2.1},n=2.)"""
+        return {name:self.spread(depths,table) for name,table in tables.items()}
  
     @property
     def keys(self):
@@ -0,0 +1,73 @@
+import numpy
+
+from .._zoning import label, group
+
+def thickness(depths):
+	"""Returns the node thickness of the samples: half the distance between the
+	neighbouring samples, and half the step at the first and last samples."""
+	depths = numpy.asarray(depths,dtype=float)
+
+	if depths.size<2:
+		return numpy.zeros(depths.shape)
+
+	nodes = numpy.gradient(depths)
+
+	nodes[[0,-1]] /= 2
+
+	return nodes
+
+def cutoff(values,depths,cuts,zones=None):
+	"""Net thickness and net-to-gross ratio for any number of cutoffs at once, where
+	the net is the thickness of the samples with values less than the cutoff.
+
+	The values are sorted once and the node thicknesses accumulated along the sorted
+	order, so each cutoff is a binary search into the cumulative sums: O(N log N + K)
+	for N samples and K cutoffs instead of rescanning the samples for every cutoff.
+
+	Parameters:
+	----------
+	values : curve values, e.g. gamma-ray or spontaneous potential
+	depths : depths of the samples
+	cuts   : cutoff values, a scalar or an array of any shape
+	zones  : hopper.Zones; if given, the results are calculated for each zone and
+			 samples above the first top are ignored
+
+	Returns:
+	-------
+	tuple: net thickness and net-to-gross ratio, both in the shape of the cutoffs, or
+		   (number of zones,)+shape of the cutoffs when zones are given.
+	"""
+	values = numpy.asarray(values,dtype=float)
+
+	nodes = thickness(depths)
+
+	cuts = numpy.asarray(cuts,dtype=float)
+
+	labels,keys = label(zones,depths,values.size)
+
+	count = len(keys)
+
+	# samples above the first top come before starts[0] and are never counted; NaN
+	# values are sorted to the end of each zone and never counted as net
+	order,starts = group(labels,count,values)
+
+	values,nodes = values[order],nodes[order]
+
+	cumulative = numpy.concatenate(([0.],numpy.cumsum(nodes)))
+
+	net = numpy.empty((count,)+cuts.shape)
+
+	for zone in range(count):
+		start,stop = starts[zone],starts[zone+1]
+		position = start+numpy.searchsorted(values[start:stop],cuts,side="left")
+		net[zone] = cumulative[position]-cumulative[start]
+
+	gross = (cumulative[starts[1:]]-cumulative[starts[:-1]]).reshape((count,)+(1,)*cuts.ndim)
+
+	with numpy.errstate(invalid="ignore",divide="ignore"):
+		ratio = net/gross
+
+	if zones is None:
+		return net[0],ratio[0]
+
+	return net,ratio
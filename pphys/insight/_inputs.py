@@ -0,0 +1,26 @@
+import numpy
+
+def split(inputs:dict,size:int=None) -> tuple:
+	"""Splits keyword inputs into curves and constants. Curves are the 1-D numpy arrays
+	of the depth size, everything else (scalars, distributions, parameter tables of
+	another length) is a constant.
+
+	Parameters:
+	----------
+	inputs : keyword inputs of a model evaluation
+	size   : number of depth samples; the length of the longest 1-D array by default
+
+	Returns:
+	-------
+	tuple: Curves and constants as dictionaries, and the number of depth samples.
+	"""
+	if size is None:
+		size = max((value.size for value in inputs.values()
+			if isinstance(value,numpy.ndarray) and value.ndim==1),default=0)
+
+	curves = {name:value for name,value in inputs.items()
+		if isinstance(value,numpy.ndarray) and value.ndim==1 and value.size==size}
+
+	constants = {name:value for name,value in inputs.items() if name not in curves}
+
+	return curves,constants,size
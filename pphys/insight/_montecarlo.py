@@ -0,0 +1,99 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+
+from ._inputs import split
+
+class montecarlo():
+	"""Monte Carlo uncertainty propagation for the interpretation models. Uncertain
+	parameters are sampled from distributions and the model is evaluated as a
+	(samples x depth) broadcast, block by block along the depth so that memory stays
+	bounded. All parameters are drawn up front from one seeded generator, so the
+	results are reproducible and do not depend on the number of workers.
+
+	Example:
+	-------
+	mc = montecarlo(lambda PHI,RT,a,m,n,rwater: archie(a,m,n).sw(PHI,rwater,RT),
+		samples=2000,seed=42)
+
+	P10,P50,P90 = mc.run(PHI=phi,RT=rt,a=1.,m=("normal",2.,0.1),n=("uniform",1.8,2.2),
+		rwater=("triangular",0.03,0.05,0.08),thickness=h,cutoff=0.5)
+
+	numpy.quantile(mc.pay,(0.1,0.5,0.9))
+	"""
+
+	def __init__(self,function,samples:int=1000,seed:int=None,chunk:int=1<<20,workers:int=None):
+		"""Initializes the Monte Carlo run.
+
+		function : model evaluation called with keyword arguments; curves are passed as
+				   arrays of shape (depth,) and sampled parameters as arrays of shape
+				   (samples,1), so the result broadcasts to (samples,depth)
+		samples  : number of realizations
+		seed 	 : seed of the random generator
+		chunk 	 : upper limit for the number of (samples x depth) values held at a time
+		workers  : number of threads evaluating depth blocks in parallel
+		"""
+		self.function = function
+
+		self.samples = samples
+		self.seed = seed
+		self.chunk = chunk
+		self.workers = workers
+
+	def run(self,quantiles:tuple=(0.1,0.5,0.9),thickness=None,cutoff:float=None,**inputs):
+		"""Evaluates the model for all realizations and returns the quantile curves.
+
+		quantiles : probabilities of the returned quantile curves
+		thickness : sample thicknesses; with cutoff, the pay (sum of thickness where the
+					result is less than or equal to the cutoff) of each realization is
+					stored in the pay attribute
+		cutoff 	  : upper limit of the result for pay, e.g. a water saturation cutoff
+		**inputs  : curves (numpy arrays along the depth), constants (scalars), or
+					distributions given as a tuple of a numpy.random.Generator method
+					name and its arguments, e.g. ("normal",2.,0.1), or as a callable
+					f(rng,size)
+
+		Returns:
+		-------
+		numpy.ndarray: Quantile curves of shape (len(quantiles),depth).
+		"""
+		rng = numpy.random.default_rng(self.seed)
+
+		curves,constants,depth = split(inputs)
+
+		params = {}
+
+		for name in sorted(constants):
+			value = constants[name]
+			if callable(value):
+				params[name] = numpy.asarray(value(rng,self.samples),dtype=float).reshape((-1,1))
+			elif isinstance(value,tuple) and isinstance(value[0],str):
+				params[name] = getattr(rng,value[0])(*value[1:],size=self.samples).reshape((-1,1))
+			else:
+				params[name] = value
+
+		block = max(1,self.chunk//self.samples)
+
+		starts = list(range(0,depth,block))
+
+		thickness = None if thickness is None or cutoff is None else numpy.asarray(thickness)
+
+		def evaluate(start):
+			stop = min(start+block,depth)
+			values = self.function(**{name:curve[start:stop] for name,curve in curves.items()},**params)
+			values = numpy.broadcast_to(values,(self.samples,stop-start))
+			curve = numpy.nanquantile(values,quantiles,axis=0)
+			if thickness is None:
+				return curve,None
+			with numpy.errstate(invalid="ignore"):
+				return curve,numpy.sum(numpy.where(values<=cutoff,thickness[start:stop],0),axis=1)
+
+		if self.workers is None or self.workers<=1:
+			results = [evaluate(start) for start in starts]
+		else:
+			with ThreadPoolExecutor(max_workers=self.workers) as executor:
+				results = list(executor.map(evaluate,starts))
+
+		self.pay = None if thickness is None else numpy.sum([pay for _,pay in results],axis=0)
+
+		return numpy.concatenate([curve for curve,_ in results],axis=1)
@@ -0,0 +1,97 @@
+from .._hash import fingerprint
+
+class pipeline():
+	"""A lightweight dependency graph of derived curves. Each node is a function of
+	other curves (its inputs) and of keyword parameters. Results are memoized on the
+	identity of the input curves and a hash of the parameters, so changing a parameter
+	recomputes only the node and the nodes downstream of it.
+
+	Example:
+	-------
+	pipe = pipeline(GR=gr,RHOB=rhob,RT=rt)
+
+	pipe.add("VSH",lambda GR,grmin,grmax: gammaray(GR,grmin=grmin,grmax=grmax).shalevolume(),
+		inputs=("GR",),grmin=15.,grmax=120.)
+	pipe.add("PHID",lambda RHOB,rhomat: density(RHOB).phi(rhomat=rhomat),inputs=("RHOB",),rhomat=2.65)
+	pipe.add("PHIE",lambda PHID,VSH: density(None).phie(PHID,VSH),inputs=("PHID","VSH"))
+	pipe.add("SW",lambda PHIE,RT,rwater,m,n: archie(m=m,n=n).sw(PHIE,rwater,RT),
+		inputs=("PHIE","RT"),rwater=0.05,m=2.,n=2.)
+	pipe.add("BVW",lambda PHIE,SW: PHIE*SW,inputs=("PHIE","SW"))
+
+	pipe["BVW"]				# computes the whole chain
+	pipe.update("SW",rwater=0.04)
+	pipe["BVW"]				# recomputes SW and BVW only
+
+	Curves are treated as immutable: replace them with set instead of editing in place.
+	"""
+
+	def __init__(self,**curves):
+		"""Initializes the pipeline with its input curves by name."""
+		self._curves = dict(curves)
+
+		self._nodes = {} # name -> (function, inputs, params)
+		self._memo = {} # name -> (inputs, parameter hash, result)
+
+	def add(self,name:str,function,inputs:tuple=(),**params):
+		"""Adds a derived curve computed as function(**inputs,**params), where the
+		inputs are passed as keyword arguments named after the input curves."""
+		if name in self._curves:
+			raise KeyError(f"'{name}' is already an input curve of the pipeline.")
+
+		self._nodes[name] = (function,tuple(inputs),dict(params))
+
+		self._memo.pop(name,None)
+
+	def set(self,**curves):
+		"""Replaces input curves; nodes depending on them are recomputed on next access."""
+		for name,values in curves.items():
+			if name in self._nodes:
+				raise KeyError(f"'{name}' is a derived curve; use update to change its parameters.")
+			self._curves[name] = values
+
+	def update(self,name:str,**params):
+		"""Changes parameters of a derived curve; it and the curves downstream of it are
+		recomputed on next access."""
+		self._nodes[name][2].update(params)
+
+	def __getitem__(self,name:str):
+		"""Returns the curve, computing the derived curves it depends on if needed."""
+		if name in self._curves:
+			return self._curves[name]
+
+		function,inputs,params = self._nodes[name]
+
+		values = {key:self[key] for key in inputs}
+
+		digest = fingerprint(params) # arrays (e.g. spread per-zone parameters) by content
+
+		memo = self._memo.get(name)
+
+		if memo is not None and memo[1] == digest and all(
+			value is cached for value,cached in zip(values.values(),memo[0])):
+			return memo[2]
+
+		result = function(**values,**params)
+
+		# the input curves are kept so that their identity can not be reused
+		self._memo[name] = (tuple(values.values()),digest,result)
+
+		return result
+
+	def __contains__(self,name:str):
+		return name in self._curves or name in self._nodes
+
+	def downstream(self,name:str) -> list:
+		"""Returns the derived curves that depend directly or indirectly on the curve."""
+		found = []
+
+		for node,(_,inputs,_) in self._nodes.items():
+			if name in inputs:
+				found += [node]+[item for item in self.downstream(node) if item not in found]
+
+		return list(dict.fromkeys(found))
+
+	@property
+	def curves(self) -> list:
+		"""Names of the input and derived curves."""
+		return list(self._curves)+list(self._nodes)
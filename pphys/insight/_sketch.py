@@ -0,0 +1,189 @@
+import numpy
+
+from .._zoning import label, group
+
+class sketch():
+	"""Streaming quantile sketch with relative accuracy (DDSketch). Values are counted
+	in logarithmic buckets, so any quantile is returned within the relative accuracy of
+	the true value while the memory depends only on the range of the values, not on
+	their number. Sketches of different wells can be merged.
+
+	Example:
+	-------
+	gr = sketch(accuracy=0.01)
+
+	for values in curves:
+		gr.add(values)
+
+	P5,P95 = gr.quantile((0.05,0.95))
+	"""
+
+	def __init__(self,accuracy:float=0.01,maxbins:int=2048):
+		"""Initializes an empty sketch.
+
+		accuracy : relative accuracy of the quantiles
+		maxbins  : upper limit for the number of buckets of each sign; above it the
+				   buckets of the smallest magnitudes are collapsed
+		"""
+		self.accuracy = accuracy
+		self.maxbins = maxbins
+
+		self.gamma = (1+accuracy)/(1-accuracy)
+
+		self.positive = [numpy.zeros(0,dtype=numpy.int64),0] # counts, key of the first bucket
+		self.negative = [numpy.zeros(0,dtype=numpy.int64),0]
+
+		self.zero = 0
+
+	def add(self,values):
+		"""Adds the finite values of an array to the sketch."""
+		values = numpy.asarray(values,dtype=float).ravel()
+
+		values = values[numpy.isfinite(values)]
+
+		self.zero += int(numpy.count_nonzero(values==0))
+
+		self._insert(self.positive,self.key(values[values>0]))
+		self._insert(self.negative,self.key(-values[values<0]))
+
+		return self
+
+	def merge(self,other):
+		"""Adds the counts of another sketch with the same accuracy."""
+		if other.gamma!=self.gamma:
+			raise ValueError("Sketches with different accuracies can not be merged.")
+
+		self.zero += other.zero
+
+		for store,counts in ((self.positive,other.positive),(self.negative,other.negative)):
+			self._insert(store,numpy.arange(counts[1],counts[1]+counts[0].size),counts[0])
+
+		return self
+
+	@property
+	def count(self):
+		"""Number of values added to the sketch."""
+		return int(self.positive[0].sum()+self.negative[0].sum())+self.zero
+
+	def quantile(self,q):
+		"""Returns the quantiles of the values for probabilities q (scalar or array);
+		NaN if the sketch is empty."""
+		q = numpy.asarray(q,dtype=float)
+
+		negkeys = numpy.arange(self.negative[1],self.negative[1]+self.negative[0].size)[::-1]
+		poskeys = numpy.arange(self.positive[1],self.positive[1]+self.positive[0].size)
+
+		# the buckets in increasing order of their values
+		values = numpy.concatenate((-self.value(negkeys),[0.],self.value(poskeys)))
+		counts = numpy.concatenate((self.negative[0][::-1],[self.zero],self.positive[0]))
+
+		cumulative = numpy.cumsum(counts)
+
+		if cumulative.size==0 or cumulative[-1]==0:
+			return numpy.full(q.shape,numpy.nan)
+
+		rank = q*(cumulative[-1]-1)
+
+		return values[numpy.searchsorted(cumulative,rank,side="right")]
+
+	def key(self,values):
+		"""Returns the bucket keys of positive values."""
+		return numpy.ceil(numpy.log(values)/numpy.log(self.gamma)).astype(numpy.int64)
+
+	def value(self,keys):
+		"""Returns the representative value of the buckets."""
+		return 2*self.gamma**keys/(self.gamma+1)
+
+	def _insert(self,store,keys,weights=None):
+
+		if keys.size==0:
+			return
+
+		counts,first = store
+
+		if counts.size==0:
+			first = int(keys.min())
+
+		lower = min(first,int(keys.min()))
+		upper = max(first+counts.size,int(keys.max())+1)
+
+		# the smallest magnitudes are collapsed into the lowest retained bucket
+		lower = max(lower,upper-self.maxbins)
+
+		keys = numpy.maximum(keys,lower)
+
+		merged = numpy.bincount(keys-lower,weights=weights,minlength=upper-lower).astype(numpy.int64)
+
+		if counts.size>0:
+			retained = numpy.maximum(numpy.arange(first,first+counts.size),lower)-lower
+			merged += numpy.bincount(retained,weights=counts,minlength=upper-lower).astype(numpy.int64)
+
+		store[0],store[1] = merged,lower
+
+class baseline():
+	"""Field-wide clean and shale gamma-ray baselines. Gamma-ray curves are ingested well
+	by well in a single pass into one quantile sketch per zone, and the pooled low and
+	high percentiles are returned as per-zone tables that gammaray consumes directly.
+
+	Example:
+	-------
+	base = baseline(clean=0.05,shale=0.95)
+
+	for las in wells:
+		base.add(las["GR"],las.index,zones=zones[las.well["WELL"].value])
+
+	gammaray(gr,depths,grmin=base.grmin,grmax=base.grmax,zones=zones)
+	"""
+
+	def __init__(self,clean:float=0.05,shale:float=0.95,accuracy:float=0.01):
+		"""Initializes the baseline picking.
+
+		clean 	 : probability of the clean (sand) baseline, P5 by default
+		shale 	 : probability of the shale baseline, P95 by default
+		accuracy : relative accuracy of the quantile sketches
+		"""
+		self.clean = clean
+		self.shale = shale
+
+		self.accuracy = accuracy
+
+		self.sketches = {}
+
+	def add(self,values,depths=None,zones=None):
+		"""Adds a gamma-ray curve; with zones (hopper.Zones) and depths, the samples are
+		added to the sketches of their zones, otherwise to the zone named "all"."""
+		values = numpy.asarray(values,dtype=float)
+
+		labels,keys = label(zones,depths,values.size)
+
+		order,starts = group(labels,len(keys))
+
+		for index,key in enumerate(keys):
+			if starts[index+1]>starts[index]:
+				self._sketch(key).add(values[order[starts[index]:starts[index+1]]])
+
+		return self
+
+	def merge(self,other):
+		"""Adds the sketches of another baseline, e.g. one built in another process."""
+		for key,value in other.sketches.items():
+			self._sketch(key).merge(value)
+
+		return self
+
+	@property
+	def grmin(self) -> dict:
+		"""Clean baselines of the zones."""
+		return {key:float(value.quantile(self.clean)) for key,value in self.sketches.items()}
+
+	@property
+	def grmax(self) -> dict:
+		"""Shale baselines of the zones."""
+		return {key:float(value.quantile(self.shale)) for key,value in self.sketches.items()}
+
+	def _sketch(self,key):
+
+		if key not in self.sketches:
+			self.sketches[key] = sketch(accuracy=self.accuracy)
+
+		return self.sketches[key]
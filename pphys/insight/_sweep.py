@@ -0,0 +1,119 @@
+import numpy
+
+from ._cutoff import thickness as nodes
+from ._inputs import split
+
+from .._zoning import label
+
+class sweep():
+	"""Parameter sensitivity sweep for Archie-type models. The model is evaluated over
+	the Cartesian grid of the parameter values as one (grid x depth) broadcast, in
+	blocks of grid points, and each block is reduced on the fly to zone-level average
+	results and net pay, so the full (grid x depth) cube is never held in memory.
+
+	Example:
+	-------
+	sens = sweep(lambda PHI,RT,m,n,rwater: archie(m=m,n=n).sw(PHI,rwater,RT))
+
+	sens.run(grid=dict(m=[1.8,2.,2.2],n=[1.8,2.,2.2],rwater=[0.03,0.05,0.08]),
+		PHI=phi,RT=rt,depths=depths,zones=zones,cutoff=0.5)
+
+	sens.average	# shape (3,3,3,number of zones)
+	sens.tornado("pay")
+	"""
+
+	def __init__(self,function,chunk:int=1<<22):
+		"""Initializes the sweep.
+
+		function : model evaluation called with keyword arguments; curves are passed as
+				   arrays of shape (depth,) and grid parameters as arrays of shape (grid,1)
+		chunk 	 : upper limit for the number of (grid x depth) values held at a time
+		"""
+		self.function = function
+		self.chunk = chunk
+
+	def run(self,grid:dict,depths=None,zones=None,thickness=None,cutoff:float=None,**inputs):
+		"""Evaluates the model for every grid point and reduces the results per zone.
+
+		grid 	  : parameter names and their values, e.g. dict(m=[1.8,2.,2.2])
+		depths 	  : depths of the samples, required for zones and for default thickness
+		zones 	  : hopper.Zones; if None, the whole curve is a single zone
+		thickness : sample thicknesses, half the distance to the neighbouring samples
+					by default (or ones if depths are not given)
+		cutoff 	  : pay is the thickness where the result is less than or equal to it
+		**inputs  : curves (numpy arrays along the depth) and constants
+
+		Sets the attributes:
+		-------------------
+		average : thickness-weighted average result, shape grid shape + (zones,)
+		pay 	: net pay thickness (if cutoff is given), same shape as average
+		"""
+		self.grid = {name:numpy.asarray(values,dtype=float) for name,values in grid.items()}
+
+		shape = tuple(values.size for values in self.grid.values())
+
+		curves,constants,depth = split(inputs,None if depths is None else len(depths))
+
+		if thickness is None and depths is not None:
+			thickness = nodes(depths)
+		elif thickness is None:
+			thickness = numpy.ones(depth)
+
+		labels,self.zones = label(zones,depths,depth)
+
+		onehot = (labels[:,None]==numpy.arange(len(self.zones))).astype(float)*numpy.asarray(thickness)[:,None]
+
+		total = int(numpy.prod(shape))
+
+		block = max(1,self.chunk//depth)
+
+		average = numpy.empty((total,len(self.zones)))
+		pay = numpy.empty((total,len(self.zones)))
+
+		for start in range(0,total,block):
+
+			points = numpy.unravel_index(numpy.arange(start,min(start+block,total)),shape)
+
+			params = {name:values[index].reshape((-1,1)) for (name,values),index in zip(self.grid.items(),points)}
+
+			values = numpy.broadcast_to(self.function(**curves,**constants,**params),(points[0].size,depth))
+
+			finite = numpy.isfinite(values)
+
+			with numpy.errstate(invalid="ignore",divide="ignore"):
+				average[start:start+block] = numpy.where(finite,values,0)@onehot/(finite@onehot)
+				if cutoff is not None:
+					pay[start:start+block] = (values<=cutoff)@onehot
+
+		self.average = average.reshape(shape+(len(self.zones),))
+		self.pay = pay.reshape(shape+(len(self.zones),)) if cutoff is not None else None
+
+		return self.average
+
+	def tornado(self,metric:str="average",base:dict=None) -> dict:
+		"""Returns tornado-chart data: for each parameter, the zone-level metric at its
+		lowest and highest grid value while the other parameters stay at their base.
+
+		metric : "average" or "pay"
+		base   : base values of the parameters; the middle grid values by default
+
+		Returns:
+		-------
+		dict: Parameter names as keys and (low, high) tuples of arrays of shape (zones,)
+			  as values, plus the metric at the base point under the key "base".
+		"""
+		cube = getattr(self,metric)
+
+		base = {} if base is None else base
+
+		center = [int(numpy.argmin(numpy.abs(values-base[name]))) if name in base else (values.size-1)//2
+			for name,values in self.grid.items()]
+
+		data = {"base":cube[tuple(center)]}
+
+		for axis,(name,values) in enumerate(self.grid.items()):
+			low,high = list(center),list(center)
+			low[axis],high[axis] = int(numpy.argmin(values)),int(numpy.argmax(values))
+			data[name] = (cube[tuple(low)],cube[tuple(high)])
+
+		return data
@@ -41,6 +41,12 @@ class neuden():
         """Calculates root mean square of neutron and density logs."""
         return self.root_mean_square
 
+    @trim
+    def shalevolume(self):
+        """Calculates shale volume from the neutron-density separation relative to
+        the separation in the shale."""
+        return (self.phin-self.phid)/(self.phinsh-self.phidsh)
+
     def lithos(self):
 
         phima = f"phima_{self.NTool}"
@@ -0,0 +1,109 @@
+import numpy
+
+from ..._inputs import split
+
+class combined():
+    """Shale volume combined from several indicators (gamma-ray, spontaneous potential,
+    neutron-density separation, ...) in one pass. The indicators are evaluated block by
+    block on cache-sized slices of their input curves and reduced to the per-sample
+    minimum or weighted average at once, so no full-length temporary is allocated per
+    indicator. The index of the winning indicator of each sample is returned for QC.
+
+    Example:
+    -------
+    vsh = combined()
+
+    vsh.add("GR",lambda GR,grmin,grmax: gammaray(GR,grmin=grmin,grmax=grmax).shalevolume(),
+        GR=gr,grmin=15.,grmax=120.)
+    vsh.add("SP",lambda SP,spsand,spshale: (SP-spsand)/(spshale-spsand),
+        SP=sp,spsand=-80.,spshale=-10.)
+    vsh.add("ND",lambda NPHI,PHID: neuden(NPHI,PHID,phinsh=0.35,phidsh=0.1).shalevolume(),
+        NPHI=nphi,PHID=phid)
+
+    values,winner = vsh.run()    # winner is 0 where GR, 1 where SP, 2 where ND is the minimum
+    """
+
+    def __init__(self,chunk:int=1<<16):
+        """Initializes the evaluator.
+
+        chunk   : number of samples evaluated at a time
+        """
+        self.chunk = chunk
+
+        self.indicators = {} # name -> (function, inputs)
+
+    def add(self,name:str,function,**inputs):
+        """Adds an indicator computed as function(**inputs). Inputs that are numpy arrays
+        along the depth are sliced into blocks, the others are passed as they are."""
+        self.indicators[name] = (function,inputs)
+
+    @property
+    def names(self) -> list:
+        """Names of the indicators in the order of the winner indices."""
+        return list(self.indicators)
+
+    def run(self,method:str="min",weights:dict=None,lower:float=0,upper:float=1):
+        """Evaluates the indicators and combines them.
+
+        method  : "min" takes the smallest indicator value of each sample; "weighted"
+                  takes the weighted average of the available indicator values
+        weights : indicator names and weights for "weighted", equal weights by default
+        lower   : lower limit of the indicator values, see trim
+        upper   : upper limit of the indicator values
+
+        Returns:
+        -------
+        tuple: Combined shale volume and the index of the winning indicator of each
+               sample, the minimum indicator for "min" and the largest weighted
+               contribution for "weighted"; -1 where no indicator is available.
+        """
+        if method not in ("min","weighted"):
+            raise ValueError(f"Unsupported method '{method}', use 'min' or 'weighted'.")
+
+        weights = {} if weights is None else weights
+
+        factors = numpy.array([weights.get(name,1.) for name in self.indicators],dtype=float)[:,None]
+
+        size = self.size
+
+        values = numpy.empty(size)
+        winner = numpy.empty(size,dtype=numpy.int8 if len(self.indicators)<128 else int)
+
+        stack = numpy.empty((len(self.indicators),min(self.chunk,size)))
+
+        evaluations = [(function,)+split(inputs,size)[:2] for function,inputs in self.indicators.values()]
+
+        for start in range(0,size,self.chunk):
+
+            stop = min(start+self.chunk,size)
+
+            block = stack[:,:stop-start]
+
+            for row,(function,curves,constants) in zip(block,evaluations):
+                row[:] = function(**{key:value[start:stop] for key,value in curves.items()},**constants)
+
+            numpy.clip(block,lower,upper,out=block)
+
+            finite = numpy.isfinite(block)
+
+            if method=="min":
+                index = numpy.argmin(numpy.where(finite,block,numpy.inf),axis=0)
+                values[start:stop] = numpy.take_along_axis(block,index[None,:],axis=0)[0]
+            else:
+                terms = numpy.where(finite,factors*block,0)
+                with numpy.errstate(invalid="ignore",divide="ignore"):
+                    values[start:stop] = terms.sum(axis=0)/numpy.where(finite,factors,0).sum(axis=0)
+                index = numpy.argmax(numpy.where(finite,terms,-numpy.inf),axis=0)
+
+            empty = ~finite.any(axis=0)
+
+            values[start:stop][empty] = numpy.nan
+
+            winner[start:stop] = numpy.where(empty,-1,index)
+
+        return values,winner
+
+    @property
+    def size(self) -> int:
+        """Number of samples, the length of the longest input curve."""
+        return max(split(inputs)[2] for _,inputs in self.indicators.values()) if self.indicators else 0
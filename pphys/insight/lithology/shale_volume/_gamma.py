@@ -1,15 +1,25 @@
+from functools import lru_cache
+
 import numpy
 
 from borepy.utils._wrappers import trim
 
+from ..._cutoff import cutoff, thickness
+
 class gammaray():
 
-    def __init__(self,values,depths=None,grmin=None,grmax=None):
+    def __init__(self,values,depths=None,grmin=None,grmax=None,zones=None):
         """Initializes gamma-ray values and depths for shale volume calculations.
-        If depths values are provided, they must be the same size as values."""
+        If depths values are provided, they must be the same size as values.
+
+        If zones (hopper.Zones) are provided, grmin and grmax can be per-formation
+        tables, e.g. {"A":15.,"B":22.}, mapped to the depths once."""
         self.values = values
         self.depths = depths
 
+        if zones is not None:
+            grmin,grmax = zones.spread(depths,grmin),zones.spread(depths,grmax)
+
         self.grmin = numpy.nanmin(values) if grmin is None else grmin
         self.grmax = numpy.nanmax(values) if grmax is None else grmax
 
@@ -24,25 +34,59 @@ class gammaray():
     @trim
     def shalevolume(self,model="linear",factor=None):
         """Calculates shale volume based on gamma ray values and selected model."""
-        return getattr(self,f"{model}")(self.value2index(self.values),factor=factor)
+        kwargs = {} if factor is None else {"factor":factor}
+        return getattr(self,f"{model}")(self.value2index(self.values),**kwargs)
 
     def cut(self,percent=40,model="linear",factor=None):
         """Calculates gamma ray values based on the given volume percent and model."""
-        return self.index2value(getattr(self,f"{model}")(None,volume=percent/100,factor=factor))
+        return self.volume2value(numpy.asarray(percent)/100,model=model,factor=factor)
+
+    def volume2value(self,volume,model="linear",factor=None):
+        """Calculates gamma ray values of the given shale volumes by interpolating the
+        tabulated inverse of the selected model."""
+        return self.index2value(gammaray.volume2index(volume,model=model,factor=factor))
+
+    @staticmethod
+    def volume2index(volume,model="linear",factor=None):
+        """Calculates shale index of the given shale volumes by interpolating the
+        tabulated inverse of the selected model."""
+        index,table = gammaray.table(model,factor)
+        return numpy.interp(volume,table,index)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def table(model="linear",factor=None,size=(1<<14)+1):
+        """Tabulates the shale volume of the selected model over the shale index in
+        [0,1] and returns the read-only (index,volume) arrays. The volume is made
+        monotone, so the table is a valid inverse for numpy.interp. Tables are cached
+        by model and factor."""
+        index = numpy.linspace(0,1,size)
+
+        kwargs = {} if factor is None else {"factor":factor}
+
+        with numpy.errstate(all="ignore"):
+            volume = getattr(gammaray,model)(index,**kwargs)
+
+        volume = numpy.maximum.accumulate(numpy.nan_to_num(volume,nan=0.))
+
+        index.setflags(write=False)
+        volume.setflags(write=False)
+
+        return index,volume
 
     def netthickness(self,**kwargs):
         """Calculates net-thickness where gamma-ray values are less than cut values.
         Cut values are calculated based on given percent and model."""
+        return numpy.sum(thickness(self.depths)[self.values<self.cut(**kwargs)])
 
-        node_above = numpy.roll(self.depths,1)
-        node_below = numpy.roll(self.depths,-1)
-
-        thickness = (node_below-node_above)/2
-
-        thickness[0] = (self.depths[1]-self.depths[0])/2
-        thickness[-1] = (self.depths[-1]-self.depths[-2])/2
+    def cutoffs(self,percents,zones=None,model="linear",factor=None):
+        """Calculates net-thickness and net-to-gross-ratio for many volume percents at
+        once, optionally for each zone (hopper.Zones), see insight._cutoff.cutoff.
 
-        return numpy.sum(thickness[self.values<self.cut(**kwargs)])
+        The samples are compared as shale indices, so per-sample grmin and grmax (zoned
+        baselines) do not broadcast against the percents."""
+        cuts = gammaray.volume2index(numpy.asarray(percents,dtype=float)/100,model=model,factor=factor)
+        return cutoff(self.value2index(self.values),self.depths,cuts,zones=zones)
 
     def netgrossratio(self,**kwargs):
         """Calculates net-to-gross-ratio based on given percent and model."""
@@ -83,7 +127,7 @@ class gammaray():
         if volume is None:
             return index**(index+factor)
         elif index is None:
-            return #could not calculate inverse yet
+            return gammaray.volume2index(volume,model="bateman",factor=factor)
 
     @staticmethod
     def stieber(index,volume=None,factor=3):
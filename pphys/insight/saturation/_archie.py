@@ -11,6 +11,12 @@ class archie:
     m  : float = 2.00 # cementation exponent
     n  : float = 2.00 # saturation exponent
 
+    @classmethod
+    def zoned(cls,zones,depths,**tables):
+        """Returns an archie model with per-sample a, m and n values taken from
+        per-formation tables, e.g. archie.zoned(zones,depths,m={"A":1.8,"B":2.1})."""
+        return cls(**zones.params(depths,**tables))
+
     def ff(self,porosity):
         """Calculates formation factor based on Archie's equation."""
         return self.a/(porosity**self.m)
@@ -1,9 +1,18 @@
 from dataclasses import dataclass
 
+import time
+
+from matplotlib import pyplot
+from matplotlib.backend_bases import MouseButton
+
 import numpy
 
 from borepy.utils._wrappers import trim
 
+from .._binned import binned
+
+from ..._zoning import group
+
 class pickett():
 
     def __init__(self,PHI=None,RT=None):
@@ -46,17 +55,111 @@ class pickett():
 
         self.intercept = intercept
 
-    def set_axis(self,axis=None):
+    def fit(self,bins:int=30,quantile:float=0.05,minpoints:int=10,depths=None,zones=None):
+        """Fits the 100% water saturation line to the lower-left envelope of the
+        log(RT) vs log(PHI) point cloud and configures the slope and intercept.
+
+        The points are split into equal-count porosity bins; the low quantile of
+        log(RT) in each bin marks the envelope, and a Theil-Sen line is fitted through
+        the envelope points, so the fit is robust to outliers and runs vectorized.
+
+        bins            : number of porosity bins
+        quantile        : resistivity quantile of the envelope in each bin
+        minpoints       : bins with fewer points are ignored
+        depths, zones   : if both are given, a separate line is fitted for each zone
+                          (hopper.Zones) and the fits are returned as a dictionary
+
+        Returns (m, aRw): the cementation exponent and the product of tortuosity and
+        formation water resistivity, or a dictionary of them for each zone.
+        """
+        logphi = numpy.log10(pickett.values(self.PHI))
+        logres = numpy.log10(pickett.values(self.RT))
+
+        valid = numpy.logical_and(numpy.isfinite(logphi),numpy.isfinite(logres))
+
+        if not hasattr(self,"archie"):
+            self.archie = {}
+
+        self.archie.setdefault("n",2.)
+
+        if zones is not None and depths is not None:
+
+            labels = zones.locate(numpy.asarray(depths))
+
+            self.fits = {}
+
+            for index,key in enumerate(zones.keys):
+                mask = numpy.logical_and(valid,labels==index)
+                if numpy.count_nonzero(mask)>=minpoints*2:
+                    self.fits[key] = pickett.envelope(logphi[mask],logres[mask],bins,quantile,minpoints)
+
+            return self.fits
+
+        m,aRw = pickett.envelope(logphi[valid],logres[valid],bins,quantile,minpoints)
+
+        self.archie["m"] = m
+
+        self.slope = -1/m
+        self.intercept = numpy.log10(aRw)/m
+
+        return m,aRw
+
+    @staticmethod
+    def envelope(logphi,logres,bins=30,quantile=0.05,minpoints=10):
+        """Returns (m, aRw) of the line fitted to the low-resistivity envelope, where
+        log(RT) = log(aRw) - m*log(PHI) along the 100% water saturation line."""
+        edges = numpy.quantile(logphi,numpy.linspace(0,1,bins+1)[1:-1])
+
+        labels = numpy.searchsorted(edges,logphi,side="right")
+
+        order,starts = group(labels,bins,logres)
+
+        counts = numpy.diff(starts)
+
+        used = counts>=minpoints
+
+        xenv = logres[order][starts[:-1][used]+numpy.floor(quantile*(counts[used]-1)).astype(int)]
+        yenv = (numpy.bincount(labels,weights=logphi,minlength=bins)/numpy.maximum(counts,1))[used]
+
+        slope,intercept = pickett.theilsen(yenv,xenv)
 
+        return -slope,10**intercept
+
+    @staticmethod
+    def theilsen(x,y):
+        """Returns the slope and intercept of the Theil-Sen line through the points."""
+        i,j = numpy.triu_indices(x.size,k=1)
+
+        dx = x[j]-x[i]
+
+        slope = numpy.median((y[j]-y[i])[dx!=0]/dx[dx!=0])
+
+        return slope,numpy.median(y-slope*x)
+
+    @staticmethod
+    def values(curve):
+        """Returns the values of a LAS curve (its data) or of an array as floats."""
+        return numpy.asarray(getattr(curve,"data",curve),dtype=float)
+
+    def set_axis(self,axis=None,bins=None):
+        """Draws the porosity-resistivity points on the axis.
+
+        bins    : if given, the points are counted on a (bins x bins) log-log grid and
+                  drawn as one image (see insight.binned); the counts are cached, so
+                  redrawing the plot does not re-bin the points.
+        """
         if axis is None:
             figure,axis = pyplot.subplots(nrows=1,ncols=1)
 
         self.axis = axis
 
-        xaxis = self.resistivity.vals
-        yaxis = self.porosity.vals
+        xaxis = pickett.values(self.RT)
+        yaxis = pickett.values(self.PHI)
 
-        self.axis.scatter(xaxis,yaxis,s=2,c="k")
+        if bins is None:
+            self.axis.scatter(xaxis,yaxis,s=2,c="k")
+        else:
+            binned.cached(xaxis,yaxis,bins=bins,xscale="log",yscale="log").draw(self.axis)
 
         self.axis.set_xscale('log')
         self.axis.set_yscale('log')
@@ -67,8 +170,8 @@ class pickett():
         self.xlim = numpy.floor(numpy.log10(xlim))+numpy.array([0,1])
         self.ylim = numpy.floor(numpy.log10(ylim))+numpy.array([0,1])
 
-        self.axis.set_xlabel(f"Resistivity [{self.resistivity.unit}]")
-        self.axis.set_ylabel(f"Porosity [{self.porosity.unit}]")
+        self.axis.set_xlabel(f"Resistivity [{getattr(self.RT,'unit','ohm.m')}]")
+        self.axis.set_ylabel(f"Porosity [{getattr(self.PHI,'unit','v/v')}]")
 
         self.axis.set_xlim(10**self.xlim)
         self.axis.set_ylim(10**self.ylim)
@@ -88,45 +191,71 @@ class pickett():
 
         [saturations.append(arg) for arg in args]
 
-        base = self.slope*self.xlim+self.intercept
+        if [line.saturation for line in self.lines]!=saturations:
 
-        for line in self.lines:
+            for line in self.lines:
 
-            line.remove()
+                line.remove()
 
-        self.lines = []
+            self.lines = []
 
-        linewidth = 1.0
+            linewidth = 1.0
 
-        alpha = 1.0
+            alpha = 1.0
 
-        X = 10**self.xlim
+            for Sw in saturations:
 
-        n = self.archie['n']
+                line, = self.axis.plot(10**self.xlim,self._line_ydata(Sw),
+                    linewidth=linewidth,color="blue",alpha=alpha)
 
-        m = -1/self.slope
+                line.saturation = Sw
 
-        for Sw in saturations:
+                linewidth -= 0.1
 
-            Sw = Sw/100
+                alpha -= 0.1
 
-            Y = 10**(base-n/m*numpy.log10(Sw))
+                self.lines.append(line)
 
-            line, = self.axis.plot(X,Y,linewidth=linewidth,color="blue",alpha=alpha)
+        else:
 
-            linewidth -= 0.1
+            self._update_lines()
 
-            alpha -= 0.1
+        self.canvas.draw_idle()
 
-            self.lines.append(line)
+    def _line_ydata(self,saturation):
+        """Porosities of the saturation line at the x-limits."""
 
-        self.canvas.draw()
+        n = self.archie['n']
 
-    def set_mouse(self):
+        m = -1/self.slope
+
+        return 10**(self.slope*self.xlim+self.intercept-n/m*numpy.log10(saturation/100))
+
+    def _update_lines(self):
+
+        for line in self.lines:
+
+            line.set_ydata(self._line_ydata(line.saturation))
+
+    def set_mouse(self,interval=1/60,callback=None):
+        """Enables dragging of the saturation lines. While dragging, the background
+        (points, axes and labels) is cached and only the lines are blitted.
 
+        interval    : minimum time in seconds between two processed mouse moves
+        callback    : called with the live water saturation curve after each processed
+                      move, e.g. to update a depth track
+        """
         self.pressed = False
         self.start = False
 
+        self.interval = interval
+        self.callback = callback
+
+        self.background = None
+        self.moved = 0.
+
+        self._pending = None
+
         self.canvas.mpl_connect('button_press_event',self._mouse_press)
         self.canvas.mpl_connect('motion_notify_event',self._mouse_move)
         self.canvas.mpl_connect('button_release_event',self._mouse_release)
@@ -143,6 +272,15 @@ class pickett():
 
         self.pressed = True
 
+        for line in self.lines:
+            line.set_animated(True)
+
+        self.canvas.draw()
+
+        self.background = self.canvas.copy_from_bbox(self.axis.bbox)
+
+        self._blit()
+
     def _mouse_move(self,event):
 
         if self.axis.get_navigate_mode()!=None: return
@@ -153,46 +291,76 @@ class pickett():
 
         self.start = True
 
-        x = numpy.log10(event.xdata)
-        y = numpy.log10(event.ydata)
+        now = time.perf_counter()
 
-        self.intercept = y-self.slope*x
+        if now-self.moved<self.interval:
+            self._pending = event
+            return
+
+        self.moved = now
+
+        self._pending = None
+
+        self._drag(event)
 
-        self.set_lines()
+        self._blit()
+
+        if self.callback is not None:
+            self.callback(self.saturation())
 
     def _mouse_release(self,event):
 
-        if self.axis.get_navigate_mode()!=None: return
-        if not event.inaxes: return
-        if event.inaxes!=self.axis: return
+        # the release is handled wherever it happens, so the lines never stay animated
+        if not self.pressed: return
 
-        if self.pressed:
+        self.pressed = False
 
-            self.pressed = False
-            self.start = False
+        moved,self.start = self.start,False
 
-            self.set_lines(50,20,10)
+        pending,self._pending = self._pending,None
 
-            return
+        # the last move may have been skipped by the throttle; a click does not move
+        if moved and pending is not None:
+            self._drag(pending)
 
-    def show(self):
+        for line in self.lines:
+            line.set_animated(False)
 
-        pyplot.show()
+        self.background = None
 
-    @trim
-    def saturation(self):
+        self.set_lines(50,20,10)
 
-        m = -1/self.slope
+        if self.callback is not None:
+            self.callback(self.saturation())
 
-        aRw = 10**(m*self.intercept)
+    def _drag(self,event):
 
-        n = self.archie['n']
+        x = numpy.log10(event.xdata)
+        y = numpy.log10(event.ydata)
 
-        Rt = self.RES
+        self.intercept = y-self.slope*x
+
+        self._update_lines()
+
+    def _blit(self):
+
+        if self.background is None: return
+
+        self.canvas.restore_region(self.background)
+
+        for line in self.lines:
+            self.axis.draw_artist(line)
 
-        phi = self.PHI
+        self.canvas.blit(self.axis.bbox)
+
+    def show(self):
+
+        pyplot.show()
+
+    @trim
+    def saturation(self):
 
-        Sw = (aRw/Rt/phi**m)**(1/n)
+        Sw = self._saturation()
 
         Sw[Sw>1] = 1
 
@@ -206,6 +374,30 @@ class pickett():
         #     unit = '-',
         #     info = info)
 
+    def _saturation(self):
+        """Returns the unclipped water saturation. The slope-dependent part is cached,
+        so a change of the intercept only (dragging the lines) rescales the cached
+        curve by a scalar instead of recomputing the powers and logarithms."""
+
+        m = -1/self.slope
+
+        n = self.archie['n']
+
+        cache = getattr(self,"_swcache",None)
+
+        if cache is None or cache[0]!=(self.slope,n) or cache[1] is not self.PHI or cache[2] is not self.RT:
+
+            aRw = 10**(m*self.intercept)
+
+            RT = pickett.values(self.RT)
+            PHI = pickett.values(self.PHI)
+
+            Sw = (aRw/RT/PHI**m)**(1/n)
+
+            self._swcache = cache = ((self.slope,n),self.PHI,self.RT,self.intercept,Sw)
+
+        return cache[4]*10**(m*(self.intercept-cache[3])/n)
+
     @property
     def depth(self):
 
@@ -0,0 +1,121 @@
+import numpy
+
+def newton(forward,derivative,arrays:tuple,x0=1.,tol=1.48e-8,maxiter=50,chunk=1<<16):
+	"""Solves forward(x,*arrays) = 0 for every element of the broadcast arrays, where
+	forward and derivative are vectorized callables of the saturation models.
+
+	The Newton steps are taken for all unconverged elements at once, following the same
+	iterates as scipy.optimize.root_scalar(method='newton') from x0. Elements with a
+	zero derivative, a non-finite iterate or no convergence within maxiter are solved
+	by bisection on a bracket [0,upper], where upper is doubled until the sign changes.
+	The arrays are solved in blocks of about chunk elements along their first axis,
+	which bounds the size of the temporaries.
+
+	Returns the roots, the iteration counts and the mask of bisection-solved elements,
+	all in the broadcast shape of the arrays."""
+	arrays = [numpy.asarray(array,dtype=float) for array in arrays]
+
+	shape = numpy.broadcast_shapes(*(array.shape for array in arrays))
+
+	ndim = max(len(shape),1)
+
+	arrays = [array.reshape((1,)*(ndim-array.ndim)+array.shape) for array in arrays]
+
+	full = shape if len(shape)>0 else (1,)
+
+	roots = numpy.empty(full)
+	iterations = numpy.empty(full,dtype=int)
+	bracketed = numpy.empty(full,dtype=bool)
+
+	rows = max(1,chunk//max(1,int(numpy.prod(full[1:]))))
+
+	for start in range(0,full[0],rows):
+
+		block = [array[start:start+rows] if array.shape[0]>1 else array for array in arrays]
+
+		bshape = numpy.broadcast_shapes(*(array.shape for array in block))
+
+		bshape = (min(rows,full[0]-start),)+bshape[1:]
+
+		flat = [numpy.broadcast_to(array,bshape).ravel() for array in block]
+
+		result = solve(forward,derivative,flat,x0,tol,maxiter)
+
+		for output,values in zip((roots,iterations,bracketed),result):
+			output[start:start+rows] = values.reshape(bshape)
+
+	return roots.reshape(shape),iterations.reshape(shape),bracketed.reshape(shape)
+
+def solve(forward,derivative,arrays:list,x0=1.,tol=1.48e-8,maxiter=50):
+	"""Safeguarded array-wide Newton solve of flat arrays, see newton."""
+	roots = numpy.full(arrays[0].size,x0,dtype=float)
+
+	iterations = numpy.zeros(roots.size,dtype=int)
+
+	active = numpy.arange(roots.size)
+
+	failed = numpy.zeros(roots.size,dtype=bool)
+
+	with numpy.errstate(all="ignore"):
+
+		for _ in range(maxiter):
+
+			if active.size==0:
+				break
+
+			x = roots[active]
+			args = [array[active] for array in arrays]
+
+			fval = forward(x,*args)
+			fder = derivative(x,*args)
+
+			xnew = numpy.where(fval==0,x,x-fval/fder)
+
+			iterations[active] += 1
+
+			bad = numpy.logical_or(~numpy.isfinite(xnew),numpy.logical_and(fder==0,fval!=0))
+
+			roots[active] = numpy.where(bad,x,xnew)
+
+			failed[active[bad]] = True
+
+			active = active[numpy.logical_and(~bad,numpy.abs(xnew-x)>tol)]
+
+		failed[active] = True
+
+		indices = numpy.flatnonzero(failed)
+
+		if indices.size>0:
+			roots[indices],count = bisect(forward,[array[indices] for array in arrays],tol)
+			iterations[indices] += count
+
+	return roots,iterations,failed
+
+def bisect(forward,arrays:list,tol=1.48e-8,maxexpand=60):
+	"""Array-wide bisection on [0,upper]; elements without a sign change are NaN."""
+	lower = numpy.zeros(arrays[0].size)
+	upper = numpy.ones(arrays[0].size)
+
+	flower = forward(lower,*arrays)
+	fupper = forward(upper,*arrays)
+
+	for _ in range(maxexpand):
+		expand = numpy.sign(flower)==numpy.sign(fupper)
+		if not expand.any():
+			break
+		upper[expand] *= 2
+		fupper[expand] = forward(upper[expand],*[array[expand] for array in arrays])
+
+	valid = numpy.sign(flower)!=numpy.sign(fupper)
+
+	count = int(numpy.ceil(numpy.log2(max(numpy.max(upper,initial=1),tol)/tol)))
+
+	for _ in range(count):
+		middle = (lower+upper)/2
+		fmiddle = forward(middle,*arrays)
+		left = numpy.sign(fmiddle)==numpy.sign(flower)
+		lower = numpy.where(left,middle,lower)
+		flower = numpy.where(left,fmiddle,flower)
+		upper = numpy.where(left,upper,middle)
+
+	return numpy.where(valid,(lower+upper)/2,numpy.nan),count
@@ -1,9 +1,7 @@
-import numpy
-
-from scipy.optimize import root_scalar
-
 from borepy.utils._wrappers import trim
 
+from .._solver import newton
+
 class dispersed():
 	"""Dispersed shale is an inexact term used to describe clay overgrowths on the
 	matrix material (for example, sand grains). These clay particles reduce porosity
@@ -64,33 +62,15 @@ class dispersed():
 
 	@trim
 	def swt_bateman(self,phit,vshale,rwater,rshale,rtotal):
-		"""Calculates total water saturation based on dispersed shale model."""
-
-		size = phit.size
-
-		saturation = numpy.zeros(size)
-
-		vshale = set_value_iterable(vshale,size)
-		rwater = set_value_iterable(rwater,size)
-		rshale = set_value_iterable(rshale,size)
-		rtotal = set_value_iterable(rtotal,size)
-
-		zipped = zip(phit,vshale,rwater,rshale,rtotal)
-
-		for index,(por,vsh,rw,rsh,rt) in enumerate(zipped):
-
-			solver = root_scalar(
-				dispersed.swt_bateman_forward,
-				method = 'newton', x0 = 1,
-				fprime = dispersed.swt_bateman_derivative,
-				args = (por,vsh,rw,rsh,rt,
-					self._archie.a,
-					self._archie.m,
-					self._archie.n,
-					),
-				)
-
-			saturation[index] = solver.root
+		"""Calculates total water saturation based on dispersed shale model. All samples
+		are solved at once by the shared array-wide Newton engine; inputs can be scalars
+		or arrays that broadcast together. The iteration count of each sample is stored
+		in the iterations attribute, and the samples solved by bisection in bracketed."""
+		saturation,self.iterations,self.bracketed = newton(
+			dispersed.swt_bateman_forward,
+			dispersed.swt_bateman_derivative,
+			(phit,vshale,rwater,rshale,rtotal,self._archie.a,self._archie.m,self._archie.n),
+			)
 
 		return saturation
 
@@ -122,12 +102,3 @@ class dispersed():
 	@property
 	def archie(self):
 		return self._archie
-
-def set_value_iterable(entry,size):
-
-	try:
-		iter(entry)
-	except TypeError:
-		entry = [entry for _ in range(size)]
-
-	return entry
\ No newline at end of file
@@ -1,9 +1,7 @@
-import numpy
-
-from scipy.optimize import root_scalar
-
 from borepy.utils._wrappers import trim
 
+from .._solver import newton
+
 class dualwater():
 	"""The dual water model proposes that two distinct waters can be found in the pore space.
 	Close to the surface of the grains, bound water of resistivity RwB is encountered. This
@@ -73,32 +71,16 @@ class dualwater():
 		rwater	: formation water resistivity
 		rtotal	: true formation resistivity
 
+		All samples are solved at once by the shared array-wide Newton engine; inputs can be
+		scalars or arrays that broadcast together. Samples that do not converge are solved
+		by bisection. The iteration count of each sample is stored in the iterations
+		attribute, and the samples solved by bisection in the bracketed attribute.
 		"""
-		size = phit.size
-
-		saturation = numpy.zeros(size)
-
-		swbound = set_value_iterable(swbound,size)
-		rwbound = set_value_iterable(rwbound,size)
-		rwater = set_value_iterable(rwater,size)
-		rtotal = set_value_iterable(rtotal,size)
-
-		zipped = zip(phit,swbound,rwbound,rwater,rtotal)
-
-		for index,(por,swb,rwb,rw,rt) in enumerate(zipped):
-
-			solver = root_scalar(
-				dualwater.swt_forward,
-				method = 'newton', x0 = 1,
-				fprime = dualwater.swt_derivative,
-				args = (por,swb,rwb,rw,rt,
-					self._archie.a,
-					self._archie.m,
-					self._archie.n,
-					),
-				)
-
-			saturation[index] = solver.root
+		saturation,self.iterations,self.bracketed = newton(
+			dualwater.swt_forward,
+			dualwater.swt_derivative,
+			(phit,swbound,rwbound,rwater,rtotal,self._archie.a,self._archie.m,self._archie.n),
+			)
 
 		return saturation
 
@@ -135,12 +117,3 @@ class dualwater():
 	@property
 	def archie(self):
 		return self._archie
-
-def set_value_iterable(entry,size):
-
-	try:
-		iter(entry)
-	except TypeError:
-		entry = [entry for _ in range(size)]
-
-	return entry	
\ No newline at end of file
@@ -1,9 +1,9 @@
 import numpy
 
-from scipy.optimize import root_scalar
-
 from borepy.utils._wrappers import trim
 
+from .._solver import newton
+
 class simandoux():
 
 	def __init__(self,archie):
@@ -12,33 +12,27 @@ class simandoux():
 
 	@trim
 	def sw(self,porosity,vshale,rwater,rshale,rtotal):
-		"""Calculates water saturation based on simandoux model."""
-
-		size = porosity.size
-
-		saturation = numpy.zeros(size)
-
-		vshale = set_value_iterable(vshale,size)
-		rwater = set_value_iterable(rwater,size)
-		rshale = set_value_iterable(rshale,size)
-		rtotal = set_value_iterable(rtotal,size)
+		"""Calculates water saturation based on simandoux model.
 
-		zipped = zip(porosity,vshale,rwater,rshale,rtotal)
+		Inputs can be scalars or per-sample arrays that broadcast together. For n=2 the
+		equation is a quadratic in Sw and is solved in closed form; for other values of n
+		all samples are solved at once by an array-wide Newton iteration."""
+		if numpy.all(numpy.asarray(self._archie.n)==2):
+			saturation = quadratic(
+				simandoux.sw_quadratic(porosity,rwater,self._archie.a,self._archie.m),
+				numpy.divide(vshale,rshale),numpy.divide(1,rtotal))
 
-		for index,(por,vsh,rw,rsh,rt) in enumerate(zipped):
+			# the closed form takes no iterations and needs no bracketing
+			self.iterations = numpy.zeros(saturation.shape,dtype=int)
+			self.bracketed = numpy.zeros(saturation.shape,dtype=bool)
 
-			solver = root_scalar(
-				simandoux.sw_forward,
-				method = 'newton', x0 = 1,
-				fprime = simandoux.sw_derivative,
-				args = (por,vsh,rw,rsh,rt,
-					self._archie.a,
-					self._archie.m,
-					self._archie.n,
-					),
-				)
+			return saturation
 
-			saturation[index] = solver.root
+		saturation,self.iterations,self.bracketed = newton(
+			simandoux.sw_forward,
+			simandoux.sw_derivative,
+			(porosity,vshale,rwater,rshale,rtotal,self._archie.a,self._archie.m,self._archie.n),
+			)
 
 		return saturation
 
@@ -58,6 +52,11 @@ class simandoux():
 		depth point based on the Simandoux model"""
 		return n*(por**m)/(a*rw)*sw**(n-1)+vsh/rsh
 
+	@staticmethod
+	def sw_quadratic(por,rw,a,m):
+		"""Returns the coefficient A of the n=2 Simandoux equation, A*(Sw)**2+B*(Sw)+C = 0"""
+		return numpy.power(por,m)/(numpy.multiply(a,rw))
+
 	@property
 	def archie(self):
 		return self._archie
@@ -80,32 +79,26 @@ class totalshale():
 
 	@trim
 	def sw(self,porosity,vshale,rwater,rshale,rtotal):
-		"""Calculates water saturation based on total shale model."""
-		size = porosity.size
-
-		saturation = numpy.zeros(size)
+		"""Calculates water saturation based on total shale model.
 
-		vshale = set_value_iterable(vshale,size)
-		rwater = set_value_iterable(rwater,size)
-		rshale = set_value_iterable(rshale,size)
-		rtotal = set_value_iterable(rtotal,size)
+		Inputs can be scalars or per-sample arrays that broadcast together. For n=2 the
+		equation is solved in closed form, otherwise by an array-wide Newton iteration."""
+		if numpy.all(numpy.asarray(self._archie.n)==2):
+			saturation = quadratic(
+				simandoux.sw_quadratic(porosity,rwater,self._archie.a,self._archie.m)/(1-numpy.asarray(vshale)),
+				numpy.divide(vshale,rshale),numpy.divide(1,rtotal))
 
-		zipped = zip(porosity,vshale,rwater,rshale,rtotal)
+			# the closed form takes no iterations and needs no bracketing
+			self.iterations = numpy.zeros(saturation.shape,dtype=int)
+			self.bracketed = numpy.zeros(saturation.shape,dtype=bool)
 
-		for index,(por,vsh,rw,rsh,rt) in enumerate(zipped):
+			return saturation
 
-			solver = root_scalar(
-				totalshale.sw_forward,
-				method = 'newton', x0 = 1,
-				fprime = totalshale.sw_derivative,
-				args = (por,vsh,rw,rsh,rt,
-					self._archie.a,
-					self._archie.m,
-					self._archie.n,
-					),
-				)
-
-			saturation[index] = solver.root
+		saturation,self.iterations,self.bracketed = newton(
+			totalshale.sw_forward,
+			totalshale.sw_derivative,
+			(porosity,vshale,rwater,rshale,rtotal,self._archie.a,self._archie.m,self._archie.n),
+			)
 
 		return saturation
 
@@ -137,14 +130,13 @@ class totalshale():
 	def bulk_water_volume(self):
 		return self.bwv
 
-def set_value_iterable(entry,size):
-
-	try:
-		iter(entry)
-	except TypeError:
-		entry = [entry for _ in range(size)]
+def quadratic(A,B,C):
+	"""Returns the positive root of A*(Sw)**2+B*(Sw)-C = 0 in the cancellation-free form
+	2C/(B+sqrt(B**2+4AC)), evaluated for all samples at once."""
+	A,B,C = numpy.broadcast_arrays(*(numpy.asarray(value,dtype=float) for value in (A,B,C)))
 
-	return entry
+	# 0-d inputs give a numpy scalar, which trim can not clip in place
+	return numpy.asarray(2*C/(B+numpy.sqrt(B**2+4*A*C)))
 
 if __name__ == "__main__":
 
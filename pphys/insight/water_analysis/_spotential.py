@@ -1,3 +1,7 @@
+import numpy
+
+from .._cutoff import cutoff, thickness
+
 class spotential():
 
     def __init__(self,SP=None,TEMP=None):
@@ -57,15 +61,15 @@ class spotential():
 
         spcut = self.cut(percent,**kwargs)
 
-        node_top = numpy.roll(self.SP.depth,1)
-        node_bottom = numpy.roll(self.SP.depth,-1)
+        return numpy.sum(thickness(self.SP.depth)[self.SP.vals<spcut])
 
-        thickness = (node_bottom-node_top)/2
+    def cutoffs(self,percents,zones=None,**kwargs):
+        """Calculates net-thickness and net-to-gross-ratio for many percents at once,
+        optionally for each zone (hopper.Zones), see insight._cutoff.cutoff."""
 
-        thickness[0] = (self.SP.depth[1].vals[0]-self.SP.depth[0].vals[0])/2
-        thickness[-1] = (self.SP.depth[-1].vals[0]-self.SP.depth[-2].vals[0])/2
+        spcut = self.cut(numpy.asarray(percents,dtype=float),**kwargs)
 
-        return numpy.sum(thickness[self.SP.vals<spcut])
+        return cutoff(self.SP.vals,self.SP.depth,spcut,zones=zones)
 
     def nettogrossratio(self,percent,**kwargs):
 